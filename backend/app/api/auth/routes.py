@@ -1,56 +1,34 @@
 """Authentication API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from fastapi.security import HTTPAuthorizationCredentials
+from typing import Annotated, Optional
 from datetime import timedelta
 
+from ..deps import CurrentUser, security
 from ...models.user import User, UserCreate, UserLogin, Token
-from ...services.auth import auth_service
+from ...services.auth import auth_service, UserAlreadyExistsError
+from ...services.auth_cache import verify_token_cached
 from ...core.config import settings
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
-security = HTTPBearer()
 
-
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    """Get current authenticated user."""
-    token = credentials.credentials
-    token_data = auth_service.verify_token(token)
-    if token_data is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user = await auth_service.get_user_by_id(token_data.user_id)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    return user
+# Settings are fixed after startup, so token lifetimes are computed once
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.access_token_expire_minutes)
+_ACCESS_TOKEN_EXPIRES_SECS = settings.access_token_expire_minutes * 60
 
 
 @router.post("/register", response_model=User)
 async def register(user_data: UserCreate):
     """Register a new user."""
-    # Check if user already exists
     try:
-        # This is a simplified check - in production, you'd want to check the database
-        existing_user = await auth_service.get_user_by_email(user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User with this email already exists"
-            )
-    except:
-        pass  # User doesn't exist, continue with registration
+        user = await auth_service.create_user(user_data)
+    except UserAlreadyExistsError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists"
+        )
     
-    user = await auth_service.create_user(user_data)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -77,43 +55,50 @@ async def login(user_credentials: UserLogin):
             detail="User account is not active"
         )
     
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = auth_service.create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
+        data={"sub": user.id}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     
     return Token(
         access_token=access_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=_ACCESS_TOKEN_EXPIRES_SECS,
         user=user
     )
 
 
 @router.get("/me", response_model=User)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: CurrentUser):
     """Get current user information."""
     return current_user
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(current_user: User = Depends(get_current_user)):
+async def refresh_token(current_user: CurrentUser):
     """Refresh access token."""
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = auth_service.create_access_token(
-        data={"sub": current_user.id}, expires_delta=access_token_expires
+        data={"sub": current_user.id}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     
     return Token(
         access_token=access_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=_ACCESS_TOKEN_EXPIRES_SECS,
         user=current_user
     )
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
-    """Logout user (client should discard token)."""
-    # In a more complex implementation, you might want to blacklist the token
+async def logout(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    current_user: CurrentUser
+):
+    """Logout user by blacklisting the current token."""
+    token = credentials.credentials
+    token_data = verify_token_cached(token)
+    if not await auth_service.revoke_token(token, token_data.exp if token_data else None):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not revoke token, please try again"
+        )
     return {"message": "Successfully logged out"}
\ No newline at end of file
@@ -1,51 +1,101 @@
 """Chat API routes with Meta Ads MCP integration."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import APIRouter, HTTPException, Response, status
 from typing import List, Dict, Any, Optional
-import json
+import asyncio
 import re
+import orjson
 
-from ...models.user import User
-from ...services.auth import auth_service
+from ..deps import CurrentUser
+from ...models.chat import AnalysisRequest, ChatRequest, ChatTurn
 from ...services.meta_ads_integration import meta_ads_integration
 from ...core.config import settings
 
 router = APIRouter(prefix="/chat", tags=["chat"])
-security = HTTPBearer()
 
+# Keyword sets matched against the tokenized user message
+KW_ACCOUNT = frozenset({"account", "accounts"})
+KW_CAMPAIGN = frozenset({"campaign", "campaigns"})
+KW_INSIGHT = frozenset({"insight", "insights", "performance", "spend", "trend", "trends"})
+KW_ADSET = frozenset({"adset", "adsets", "targeting"})
+KW_AD = frozenset({"ads", "creative", "creatives"})
+KW_CHART = frozenset({"chart", "graph", "visualize", "show"})
+KW_ADVICE = frozenset({"performance", "how"})
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    """Get current authenticated user."""
-    token = credentials.credentials
-    token_data = auth_service.verify_token(token)
-    if token_data is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user = await auth_service.get_user_by_id(token_data.user_id)
-    if user is None:
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Static suggestions, encoded once at import
+_SUGGESTIONS_JSON = orjson.dumps({
+    "suggestions": [
+        "Show me my ad accounts",
+        "What are my campaign performance metrics?",
+        "Generate a chart of my daily spend",
+        "Which campaigns have the best CTR?",
+        "Show me impressions by campaign",
+        "What are your recommendations for improving performance?",
+        "Show me my ad sets and targeting",
+        "What's my current ad spend trend?"
+    ]
+})
+
+# Data categories as (keywords, MCP tool, params builder); a message may match several
+CATEGORIES = [
+    (
+        KW_ACCOUNT,
+        "mcp_meta_ads_get_ad_accounts",
+        lambda user: {"access_token": user.meta_access_token},
+    ),
+    (
+        KW_CAMPAIGN,
+        "mcp_meta_ads_get_campaigns",
+        lambda user: {"account_id": "act_123456789", "access_token": user.meta_access_token},
+    ),
+    (
+        KW_INSIGHT,
+        "mcp_meta_ads_get_insights",
+        lambda user: {"object_id": "123456789", "access_token": user.meta_access_token},
+    ),
+    (
+        KW_ADSET,
+        "mcp_meta_ads_get_adsets",
+        lambda user: {"account_id": "act_123456789", "access_token": user.meta_access_token},
+    ),
+    (
+        KW_AD,
+        "mcp_meta_ads_get_ads",
+        lambda user: {"account_id": "act_123456789", "access_token": user.meta_access_token},
+    ),
+]
+
+
+def _tokenize(message: str) -> frozenset:
+    """Split a message into a set of lowercase words."""
+    return frozenset(_WORD_RE.findall(message.lower().replace("ad set", "adset")))
+
+
+async def _noop() -> None:
+    """Placeholder for optional steps in an asyncio.gather fan-out."""
+    return None
+
+
+def _raise_for_mcp_error(result: Dict[str, Any]) -> None:
+    """Surface a failed MCP tool call as a 502 instead of a generic 500."""
+    if "error" in result:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Meta Ads MCP error: {result['error']}"
         )
-    
-    return user
 
 
 @router.post("/message")
 async def send_message(
-    message: Dict[str, Any],
-    current_user: User = Depends(get_current_user)
+    message: ChatRequest,
+    current_user: CurrentUser
 ):
     """Send a message to the AI assistant with Meta Ads integration."""
     try:
-        user_message = message.get("content", "")
-        conversation_history = message.get("history", [])
+        user_message = message.content
+        conversation_history = message.history
         
         # Analyze the message to determine what data to fetch
         data = {}
@@ -53,53 +103,30 @@ async def send_message(
         recommendations = []
         
         # Check for specific keywords to determine what data to fetch
-        lower_message = user_message.lower()
+        tokens = _tokenize(user_message)
         
-        if any(keyword in lower_message for keyword in ["account", "accounts"]):
-            # Get ad accounts
-            data = await meta_ads_integration.call_mcp_tool(
-                "mcp_meta_ads_get_ad_accounts",
-                {"access_token": current_user.meta_access_token}
-            )
+        # Fetch every matching category in a single concurrent batch
+        results = await asyncio.gather(*(
+            meta_ads_integration.call_mcp_tool(tool_name, build_params(current_user))
+            for keywords, tool_name, build_params in CATEGORIES
+            if tokens & keywords
+        ))
+        for result in results:
+            _raise_for_mcp_error(result)
+            data.update(result)
         
-        elif any(keyword in lower_message for keyword in ["campaign", "campaigns"]):
-            # Get campaigns
-            data = await meta_ads_integration.call_mcp_tool(
-                "mcp_meta_ads_get_campaigns",
-                {"account_id": "act_123456789", "access_token": current_user.meta_access_token}
-            )
-            
-            # Generate recommendations
-            recommendations = await meta_ads_integration.get_ai_recommendations(data)
-            
-            # Check if user wants a chart
-            if any(keyword in lower_message for keyword in ["chart", "graph", "visualize", "show"]):
-                chart_data = await meta_ads_integration.generate_chart_data("campaign_performance", data)
+        # Check if user wants a chart
+        wants_chart = bool(tokens & KW_CHART)
         
-        elif any(keyword in lower_message for keyword in ["insight", "performance", "spend", "trend"]):
-            # Get insights
-            data = await meta_ads_integration.call_mcp_tool(
-                "mcp_meta_ads_get_insights",
-                {"object_id": "123456789", "access_token": current_user.meta_access_token}
+        if "campaigns" in data:
+            # Generate recommendations and, if the user wants one, a chart concurrently
+            recommendations, chart_data = await asyncio.gather(
+                meta_ads_integration.get_ai_recommendations(data),
+                meta_ads_integration.generate_chart_data("campaign_performance", data) if wants_chart else _noop()
             )
-            
-            # Check if user wants a chart
-            if any(keyword in lower_message for keyword in ["chart", "graph", "visualize", "show"]):
-                chart_data = await meta_ads_integration.generate_chart_data("spend_trend", data)
         
-        elif any(keyword in lower_message for keyword in ["adset", "ad set", "targeting"]):
-            # Get ad sets
-            data = await meta_ads_integration.call_mcp_tool(
-                "mcp_meta_ads_get_adsets",
-                {"account_id": "act_123456789", "access_token": current_user.meta_access_token}
-            )
-        
-        elif any(keyword in lower_message for keyword in ["ad", "ads", "creative"]):
-            # Get ads
-            data = await meta_ads_integration.call_mcp_tool(
-                "mcp_meta_ads_get_ads",
-                {"account_id": "act_123456789", "access_token": current_user.meta_access_token}
-            )
+        elif "insights" in data and wants_chart:
+            chart_data = await meta_ads_integration.generate_chart_data("spend_trend", data)
         
         # Generate AI response
         ai_response = await generate_ai_response(
@@ -117,6 +144,8 @@ async def send_message(
             "recommendations": recommendations
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -129,7 +158,7 @@ async def generate_ai_response(
     data: Dict[str, Any],
     chart_data: Optional[Dict[str, Any]],
     recommendations: List[str],
-    conversation_history: List[Dict[str, Any]]
+    conversation_history: List[ChatTurn]
 ) -> str:
     """Generate AI response based on user message and Meta Ads data."""
     
@@ -143,23 +172,30 @@ async def generate_ai_response(
         if "accounts" in data:
             accounts = data["accounts"]
             response_parts.append(f"I found {len(accounts)} ad account(s):")
-            for account in accounts:
-                response_parts.append(f"• {account['name']} ({account['id']}) - {account['status']}")
+            response_parts.append("\n".join(
+                f"• {account['name']} ({account['id']}) - {account['status']}"
+                for account in accounts
+            ))
         
-        elif "campaigns" in data:
+        if "campaigns" in data:
             campaigns = data["campaigns"]
             response_parts.append(f"I found {len(campaigns)} campaign(s):")
-            for campaign in campaigns:
-                spend = campaign.get("spend", 0) / 100
-                response_parts.append(
-                    f"• {campaign['name']} - {campaign['status']} - "
-                    f"CTR: {campaign.get('ctr', 0)}% - Spend: ${spend:.2f}"
-                )
+            response_parts.append("\n".join(
+                f"• {campaign['name']} - {campaign['status']} - "
+                f"CTR: {campaign.get('ctr', 0)}% - Spend: ${campaign.get('spend', 0) / 100:.2f}"
+                for campaign in campaigns
+            ))
         
-        elif "insights" in data:
+        if "insights" in data:
             insights = data["insights"]
-            total_spend = sum(insight.get("spend", 0) for insight in insights) / 100
-            avg_ctr = sum(insight.get("ctr", 0) for insight in insights) / len(insights)
+            total_spend = 0
+            total_ctr = 0
+            for insight in insights:
+                total_spend += insight.get("spend", 0)
+                total_ctr += insight.get("ctr", 0)
+            total_spend /= 100
+            n = len(insights)
+            avg_ctr = total_ctr / n if n else 0.0
             response_parts.append(
                 f"Performance insights: Total spend ${total_spend:.2f}, "
                 f"Average CTR {avg_ctr:.2f}%"
@@ -168,15 +204,14 @@ async def generate_ai_response(
     # Add recommendations
     if recommendations:
         response_parts.append("\n💡 Recommendations:")
-        for rec in recommendations:
-            response_parts.append(f"• {rec}")
+        response_parts.append("\n".join(f"• {rec}" for rec in recommendations))
     
     # Add chart information if available
     if chart_data:
         response_parts.append("\n📊 I've generated a chart to visualize this data.")
     
     # Add general advice based on the query
-    if "performance" in user_message.lower() or "how" in user_message.lower():
+    if _tokenize(user_message) & KW_ADVICE:
         response_parts.append(
             "\n💡 To improve performance, consider:\n"
             "• Optimizing ad creative and copy\n"
@@ -199,52 +234,58 @@ async def generate_ai_response(
 
 
 @router.get("/suggestions")
-async def get_suggestions(current_user: User = Depends(get_current_user)):
+async def get_suggestions(current_user: CurrentUser):
     """Get suggested questions for the chat."""
-    return {
-        "suggestions": [
-            "Show me my ad accounts",
-            "What are my campaign performance metrics?",
-            "Generate a chart of my daily spend",
-            "Which campaigns have the best CTR?",
-            "Show me impressions by campaign",
-            "What are your recommendations for improving performance?",
-            "Show me my ad sets and targeting",
-            "What's my current ad spend trend?"
-        ]
-    }
+    return Response(content=_SUGGESTIONS_JSON, media_type="application/json")
 
 
 @router.post("/analyze")
 async def analyze_campaigns(
-    analysis_request: Dict[str, Any],
-    current_user: User = Depends(get_current_user)
+    analysis_request: AnalysisRequest,
+    current_user: CurrentUser
 ):
     """Analyze campaigns and provide insights."""
     try:
         # Get campaign data
         campaign_data = await meta_ads_integration.call_mcp_tool(
             "mcp_meta_ads_get_campaigns",
-            {"account_id": "act_123456789", "access_token": current_user.meta_access_token}
+            {
+                "account_id": analysis_request.account_id or "act_123456789",
+                "access_token": current_user.meta_access_token
+            }
         )
+        _raise_for_mcp_error(campaign_data)
         
-        # Generate recommendations
-        recommendations = await meta_ads_integration.get_ai_recommendations(campaign_data)
+        # Generate recommendations and chart data concurrently
+        recommendations, chart_data = await asyncio.gather(
+            meta_ads_integration.get_ai_recommendations(campaign_data),
+            meta_ads_integration.generate_chart_data("campaign_performance", campaign_data)
+        )
         
-        # Generate chart data
-        chart_data = await meta_ads_integration.generate_chart_data("campaign_performance", campaign_data)
+        # Aggregate campaign stats in a single pass
+        campaigns = campaign_data.get("campaigns", [])
+        n = len(campaigns)
+        active_campaigns = 0
+        total_spend = 0
+        total_ctr = 0
+        for campaign in campaigns:
+            active_campaigns += campaign.get("status") == "ACTIVE"
+            total_spend += campaign.get("spend", 0)
+            total_ctr += campaign.get("ctr", 0)
         
         return {
             "analysis": {
-                "total_campaigns": len(campaign_data.get("campaigns", [])),
-                "active_campaigns": len([c for c in campaign_data.get("campaigns", []) if c.get("status") == "ACTIVE"]),
-                "total_spend": sum(c.get("spend", 0) for c in campaign_data.get("campaigns", [])) / 100,
-                "avg_ctr": sum(c.get("ctr", 0) for c in campaign_data.get("campaigns", [])) / len(campaign_data.get("campaigns", []))
+                "total_campaigns": n,
+                "active_campaigns": active_campaigns,
+                "total_spend": total_spend / 100,
+                "avg_ctr": total_ctr / n if n else 0.0
             },
             "recommendations": recommendations,
             "chart_data": chart_data
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,39 @@
+"""Shared API dependencies."""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+
+from ..models.user import User
+from ..services.auth import auth_service
+from ..services.auth_cache import verify_token_cached
+from ..services.user_cache import user_cache_service
+
+security = HTTPBearer()
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
+    """Get current authenticated user."""
+    token = credentials.credentials
+    token_data = verify_token_cached(token)
+    if token_data is None or await auth_service.is_token_revoked(token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = await user_cache_service.get(token_data.user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return user
+
+
+# Shared alias so every router resolves the same dependency callable
+CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -1,42 +1,62 @@
 """Meta Ads API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from typing import Annotated, List, Dict, Any, Optional
 from datetime import datetime
+import asyncio
+import hashlib
+from cachetools import TTLCache
 
-from ...models.user import User
-from ...services.auth import auth_service
+from ..deps import CurrentUser
+from ...models.meta import BatchOp, BatchRequest
 from ...services.meta_integration import meta_integration
 from ...core.config import settings
 
 router = APIRouter(prefix="/meta", tags=["meta"])
-security = HTTPBearer()
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    """Get current authenticated user."""
-    try:
-        user = await auth_service.get_user_by_token(credentials.credentials)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
-            )
-        return user
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials"
-        )
+# Meta access tokens travel in a header so they stay out of URLs and access logs
+MetaToken = Annotated[str, Header(alias="X-Meta-Token")]
+
+
+async def _private_cache(response: Response) -> None:
+    """Allow the client (but not shared caches) to reuse GET responses briefly."""
+    response.headers["Cache-Control"] = "private, max-age=30"
+    response.headers["Vary"] = "Authorization, X-Meta-Token"
+
+
+async def _no_store(response: Response) -> None:
+    """Keep responses that must be fresh (token validity, realtime data) out of caches."""
+    response.headers["Cache-Control"] = "no-store"
+
+
+# Short-lived cache keyed by a hash of the Meta access token (never the raw token)
+_TOKEN_OK: TTLCache = TTLCache(maxsize=50000, ttl=60)
+
+
+def _token_key(access_token: str) -> bytes:
+    return hashlib.sha256(access_token.encode()).digest()
+
+
+async def _cached_validate(access_token: str) -> bool:
+    """Validate a Meta access token, reusing recent successful checks."""
+    key = _token_key(access_token)
+    if key in _TOKEN_OK:
+        return True
+    is_valid = await meta_integration.validate_access_token(access_token)
+    # Only successes are cached: False may just mean Graph could not be reached
+    if is_valid:
+        _TOKEN_OK[key] = True
+    return is_valid
 
-@router.get("/validate-token")
+
+@router.get("/validate-token", dependencies=[Depends(_no_store)])
 async def validate_meta_token(
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Validate Meta access token."""
     try:
-        is_valid = await meta_integration.validate_access_token(access_token)
+        is_valid = await _cached_validate(access_token)
         return {"valid": is_valid}
     except Exception as e:
         raise HTTPException(
@@ -44,10 +64,10 @@ async def validate_meta_token(
             detail=f"Failed to validate token: {str(e)}"
         )
 
-@router.get("/user-info")
+@router.get("/user-info", dependencies=[Depends(_private_cache)])
 async def get_meta_user_info(
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get Meta user information."""
     try:
@@ -64,10 +84,10 @@ async def get_meta_user_info(
             detail=f"Failed to get user info: {str(e)}"
         )
 
-@router.get("/ad-accounts")
+@router.get("/ad-accounts", dependencies=[Depends(_private_cache)])
 async def get_ad_accounts(
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get user's ad accounts."""
     try:
@@ -79,11 +99,11 @@ async def get_ad_accounts(
             detail=f"Failed to get ad accounts: {str(e)}"
         )
 
-@router.get("/campaigns/{account_id}")
+@router.get("/campaigns/{account_id}", dependencies=[Depends(_private_cache)])
 async def get_campaigns(
     account_id: str,
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get campaigns for an ad account."""
     try:
@@ -95,13 +115,13 @@ async def get_campaigns(
             detail=f"Failed to get campaigns: {str(e)}"
         )
 
-@router.get("/insights/{object_id}")
+@router.get("/insights/{object_id}", dependencies=[Depends(_private_cache)])
 async def get_insights(
     object_id: str,
-    access_token: str,
+    access_token: MetaToken,
+    current_user: CurrentUser,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    current_user: User = Depends(get_current_user)
+    end_date: Optional[str] = None
 ):
     """Get insights for a campaign, ad set, or ad."""
     try:
@@ -117,11 +137,11 @@ async def get_insights(
             detail=f"Failed to get insights: {str(e)}"
         )
 
-@router.get("/ad-sets/{campaign_id}")
+@router.get("/ad-sets/{campaign_id}", dependencies=[Depends(_private_cache)])
 async def get_ad_sets(
     campaign_id: str,
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get ad sets for a campaign."""
     try:
@@ -133,11 +153,11 @@ async def get_ad_sets(
             detail=f"Failed to get ad sets: {str(e)}"
         )
 
-@router.get("/ads/{adset_id}")
+@router.get("/ads/{adset_id}", dependencies=[Depends(_private_cache)])
 async def get_ads(
     adset_id: str,
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get ads for an ad set."""
     try:
@@ -153,8 +173,8 @@ async def get_ads(
 async def update_campaign_status(
     campaign_id: str,
     status_update: Dict[str, str],
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Update campaign status."""
     try:
@@ -183,8 +203,8 @@ async def update_campaign_status(
 async def update_campaign_budget(
     campaign_id: str,
     budget_update: Dict[str, int],
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Update campaign budget."""
     try:
@@ -209,11 +229,11 @@ async def update_campaign_budget(
             detail=f"Failed to update campaign budget: {str(e)}"
         )
 
-@router.get("/realtime/{account_id}")
+@router.get("/realtime/{account_id}", dependencies=[Depends(_no_store)])
 async def get_realtime_insights(
     account_id: str,
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get real-time insights for an account."""
     try:
@@ -225,11 +245,11 @@ async def get_realtime_insights(
             detail=f"Failed to get real-time insights: {str(e)}"
         )
 
-@router.get("/strategies/{account_id}")
+@router.get("/strategies/{account_id}", dependencies=[Depends(_private_cache)])
 async def generate_strategies(
     account_id: str,
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Generate optimization strategies for an account."""
     try:
@@ -244,8 +264,8 @@ async def generate_strategies(
 @router.post("/strategies/execute")
 async def execute_strategy(
     strategy: Dict[str, Any],
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Execute an optimization strategy."""
     try:
@@ -263,11 +283,27 @@ async def execute_strategy(
             detail=f"Failed to execute strategy: {str(e)}"
         )
 
-@router.get("/performance/{account_id}")
+@router.get("/overview/{account_id}", dependencies=[Depends(_private_cache)])
+async def get_account_overview(
+    account_id: str,
+    access_token: MetaToken,
+    current_user: CurrentUser
+):
+    """Get campaigns and recent insights for an account in one Graph round-trip."""
+    try:
+        overview = await meta_integration.get_account_overview(account_id, access_token)
+        return overview
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get account overview: {str(e)}"
+        )
+
+@router.get("/performance/{account_id}", dependencies=[Depends(_private_cache)])
 async def get_account_performance(
     account_id: str,
-    access_token: str,
-    current_user: User = Depends(get_current_user)
+    access_token: MetaToken,
+    current_user: CurrentUser
 ):
     """Get account performance summary."""
     try:
@@ -277,4 +313,44 @@ async def get_account_performance(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get account performance: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+# Batch op name -> coroutine factory taking (args, access_token); BatchOp has
+# already checked that the ID argument each op reads is present
+_BATCH_DISPATCH = {
+    "user_info": lambda args, token: meta_integration.get_user_info(token),
+    "ad_accounts": lambda args, token: meta_integration.get_ad_accounts(token),
+    "campaigns": lambda args, token: meta_integration.get_campaigns(args.account_id, token),
+    "insights": lambda args, token: meta_integration.get_insights(
+        args.object_id, token, args.date_range.model_dump() if args.date_range else None
+    ),
+    "ad_sets": lambda args, token: meta_integration.get_ad_sets(args.campaign_id, token),
+    "ads": lambda args, token: meta_integration.get_ads(args.adset_id, token),
+    "realtime": lambda args, token: meta_integration.get_realtime_insights(args.account_id, token),
+    "performance": lambda args, token: meta_integration.get_account_performance_summary(args.account_id, token),
+    "overview": lambda args, token: meta_integration.get_account_overview(args.account_id, token),
+}
+
+
+async def _run_batch_op(batch_op: BatchOp, access_token: str) -> Any:
+    """Dispatch one batch operation, so any failure is reported against that op only."""
+    return await _BATCH_DISPATCH[batch_op.op](batch_op.args, access_token)
+
+@router.post("/batch")
+async def batch(
+    batch_request: BatchRequest,
+    access_token: MetaToken,
+    current_user: CurrentUser
+):
+    """Run several read operations concurrently in one request."""
+    results = await asyncio.gather(
+        *(_run_batch_op(batch_op, access_token) for batch_op in batch_request.ops),
+        return_exceptions=True
+    )
+    return {
+        "results": [
+            {"op": batch_op.op, "error": str(result)} if isinstance(result, Exception)
+            else {"op": batch_op.op, "data": result}
+            for batch_op, result in zip(batch_request.ops, results)
+        ]
+    }
\ No newline at end of file
@@ -27,20 +27,28 @@ class Settings(BaseSettings):
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    password_hash_scheme: str = "bcrypt"  # "bcrypt" or "argon2"
+    bcrypt_rounds: int = 12
 
     # Database
     database_url: Optional[str] = None
 
     # Redis
     redis_url: str = "redis://localhost:6379"
+    user_cache_ttl_seconds: int = 60
 
     # Meta Ads API
     meta_app_id_legacy: Optional[str] = None
     meta_app_secret_legacy: Optional[str] = None
+    meta_rate_limit_capacity: int = 100
+    meta_rate_limit_refill_per_second: float = 20.0
 
     # CORS
     allowed_origins: list = ["http://localhost:3000", "http://localhost:3001"]
 
+    # Trusted hosts
+    allowed_hosts: list = ["localhost", "127.0.0.1", "backend"]
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,13 @@
+"""Redis client configuration."""
+
+from redis.asyncio import Redis
+from .config import settings
+
+
+def get_redis_client() -> Redis:
+    """Get Redis client instance."""
+    return Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+# Global Redis client instance (connections are opened lazily)
+redis_client = get_redis_client()
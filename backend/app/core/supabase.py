@@ -1,13 +1,13 @@
 """Supabase client configuration."""
 
+from functools import lru_cache
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from .config import settings
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Get Supabase client instance."""
-    return create_client(settings.supabase_url, settings.supabase_anon_key)
-
-
-# Global Supabase client instance
-supabase = get_supabase_client()
\ No newline at end of file
+    """Get the shared Supabase client instance, creating it on first use."""
+    options = ClientOptions(postgrest_client_timeout=10, schema="public")
+    return create_client(settings.supabase_url, settings.supabase_anon_key, options=options)
@@ -1,54 +1,31 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from .core.config import settings
 from .api.auth.routes import router as auth_router
 from .api.chat.routes import router as chat_router
 from .api.meta.routes import router as meta_router
+from .services.meta_ads_integration import meta_ads_integration
+from .services.meta_integration import meta_integration
 
-# Create FastAPI app
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="Meta Ads Full-Stack Application API",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Add trusted host middleware
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=["*"]  # Configure appropriately for production
-)
-
-# Include routers
-app.include_router(auth_router, prefix="/api/auth")
-app.include_router(chat_router, prefix="/api/chat")
-app.include_router(meta_router, prefix="/api/meta")
-
-@app.get("/")
+system_router = APIRouter()
+
+
+@system_router.get("/")
 async def root():
     """Root endpoint."""
     return {
         "message": "Meta Ads Full-Stack Application API",
         "version": settings.app_version,
-        "docs": "/docs"
+        "docs": "/docs" if settings.debug else None
     }
 
-@app.get("/health")
+@system_router.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {
@@ -56,7 +33,7 @@ async def health_check():
         "timestamp": "2024-01-01T00:00:00Z"
     }
 
-@app.get("/api/health")
+@system_router.get("/api/health")
 async def api_health_check():
     """API health check endpoint."""
     return {
@@ -66,6 +43,65 @@ async def api_health_check():
     }
 
 
+def _install_middleware(app: FastAPI) -> None:
+    """Add CORS and trusted host middleware."""
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["authorization", "content-type", "x-meta-token"],
+    )
+
+    app.add_middleware(
+        TrustedHostMiddleware,
+        allowed_hosts=settings.allowed_hosts
+    )
+
+
+def _install_routers(app: FastAPI) -> None:
+    """Include the API routers."""
+    app.include_router(system_router)
+    app.include_router(auth_router, prefix="/api/auth")
+    app.include_router(chat_router, prefix="/api/chat")
+    app.include_router(meta_router, prefix="/api/meta")
+
+
+def create_app() -> FastAPI:
+    """Create a configured FastAPI application."""
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.app_version,
+        description="Meta Ads Full-Stack Application API",
+        docs_url="/docs" if settings.debug else None,
+        redoc_url=None,
+        openapi_url="/openapi.json" if settings.debug else None,
+        default_response_class=ORJSONResponse
+    )
+    _install_middleware(app)
+    _install_routers(app)
+
+    if settings.debug:
+        @app.on_event("startup")
+        async def warm_openapi_schema():
+            """Build the OpenAPI schema before the first request."""
+            app.openapi()
+
+    return app
+
+
+app = create_app()
+
+
+# The outbound HTTP clients are process-wide, so only the served app closes them;
+# other instances from create_app() (e.g. in tests) leave them open for each other
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close pooled outbound HTTP clients."""
+    await meta_ads_integration.close()
+    await meta_integration.close()
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
@@ -73,4 +109,4 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.debug,
         log_level="info"
-    )
\ No newline at end of file
+    )
@@ -1,6 +1,6 @@
 """Chat models and schemas."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -23,8 +23,7 @@ class ChatMessage(BaseModel):
     created_at: Optional[datetime] = None
     metadata: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ChatSession(BaseModel):
@@ -37,8 +36,7 @@ class ChatSession(BaseModel):
     is_active: bool = True
     metadata: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ChatCreate(BaseModel):
@@ -62,4 +60,21 @@ class ChatResponse(BaseModel):
 class ChatListResponse(BaseModel):
     """Chat list response model."""
     chats: List[ChatSession]
-    total: int
\ No newline at end of file
+    total: int
+
+
+class ChatTurn(BaseModel):
+    """Single turn of conversation history sent with a chat request."""
+    role: MessageType
+    content: str
+
+
+class ChatRequest(BaseModel):
+    """Chat message request model."""
+    content: str = ""
+    history: List[ChatTurn] = []
+
+
+class AnalysisRequest(BaseModel):
+    """Campaign analysis request model."""
+    account_id: Optional[str] = None
@@ -0,0 +1,62 @@
+"""Meta Ads API models and schemas."""
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Literal, Optional
+
+
+class DateRange(BaseModel):
+    """Inclusive insights date range (YYYY-MM-DD)."""
+    start: str
+    end: str
+
+
+class BatchArgs(BaseModel):
+    """Arguments for a batch operation; which ID is required depends on the op."""
+    model_config = ConfigDict(extra="forbid")
+
+    account_id: Optional[str] = None
+    object_id: Optional[str] = None
+    campaign_id: Optional[str] = None
+    adset_id: Optional[str] = None
+    date_range: Optional[DateRange] = None
+
+
+# ID argument each batch op needs; ops not listed take none
+BATCH_REQUIRED_ARGS = {
+    "campaigns": "account_id",
+    "insights": "object_id",
+    "ad_sets": "campaign_id",
+    "ads": "adset_id",
+    "realtime": "account_id",
+    "performance": "account_id",
+    "overview": "account_id",
+}
+
+
+class BatchOp(BaseModel):
+    """Single read operation in a Meta batch request."""
+    op: Literal[
+        "user_info",
+        "ad_accounts",
+        "campaigns",
+        "insights",
+        "ad_sets",
+        "ads",
+        "realtime",
+        "performance",
+        "overview",
+    ]
+    args: BatchArgs = Field(default_factory=BatchArgs)
+
+    @model_validator(mode="after")
+    def check_required_args(self) -> "BatchOp":
+        """Reject ops missing the ID argument they dispatch on."""
+        required = BATCH_REQUIRED_ARGS.get(self.op)
+        if required and getattr(self.args, required) is None:
+            raise ValueError(f"{self.op} requires args.{required}")
+        return self
+
+
+class BatchRequest(BaseModel):
+    """Meta batch request model."""
+    ops: List[BatchOp] = Field(..., min_length=1, max_length=50)
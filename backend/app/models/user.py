@@ -1,6 +1,7 @@
 """User models and schemas."""
 
-from pydantic import BaseModel, EmailStr
+import msgspec
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -42,8 +43,7 @@ class UserInDB(UserBase):
     meta_access_token: Optional[str] = None
     meta_user_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class User(UserInDB):
@@ -65,6 +65,7 @@ class Token(BaseModel):
     user: User
 
 
-class TokenData(BaseModel):
-    """Token data model."""
-    user_id: Optional[str] = None
\ No newline at end of file
+class TokenData(msgspec.Struct, frozen=True):
+    """Token data model (internal; built on every authenticated request)."""
+    user_id: Optional[str] = None
+    exp: Optional[int] = None
\ No newline at end of file
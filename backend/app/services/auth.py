@@ -1,15 +1,33 @@
 """Authentication service using Supabase."""
 
+import hashlib
+import logging
+import time
 from typing import Optional
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from gotrue.errors import AuthApiError
+import jwt
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from redis.exceptions import RedisError
 from ..core.config import settings
-from ..core.supabase import supabase
+from ..core.redis import redis_client
+from ..core.supabase import get_supabase_client
 from ..models.user import User, UserCreate, UserLogin, Token, TokenData
 
+logger = logging.getLogger(__name__)
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+argon2_hasher = PasswordHasher()
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# JWT signing key, encoded once instead of on every encode/decode
+_jwt_key = settings.secret_key.encode()
+
+
+class UserAlreadyExistsError(Exception):
+    """Raised when registering an email that already has an account."""
 
 
 class AuthService:
@@ -17,13 +35,23 @@ class AuthService:
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        """Verify a password against its bcrypt or argon2 hash."""
+        if hashed_password.startswith("$argon2"):
+            try:
+                return argon2_hasher.verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False
+        # Skip the KDF entirely for anything that is not a well-formed bcrypt hash
+        if len(hashed_password) != 60 or not hashed_password.startswith(_BCRYPT_PREFIXES):
+            return False
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
     
     @staticmethod
     def get_password_hash(password: str) -> str:
-        """Hash a password."""
-        return pwd_context.hash(password)
+        """Hash a password with the configured scheme."""
+        if settings.password_hash_scheme == "argon2":
+            return argon2_hasher.hash(password)
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode()
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -35,27 +63,62 @@ class AuthService:
             expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
         
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        encoded_jwt = jwt.encode(to_encode, _jwt_key, algorithm=settings.algorithm)
         return encoded_jwt
     
     @staticmethod
     def verify_token(token: str) -> Optional[TokenData]:
         """Verify and decode a JWT token."""
         try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+            payload = jwt.decode(token, _jwt_key, algorithms=[settings.algorithm])
             user_id: str = payload.get("sub")
             if user_id is None:
                 return None
-            return TokenData(user_id=user_id)
-        except JWTError:
+            return TokenData(user_id=user_id, exp=payload.get("exp"))
+        except jwt.PyJWTError:
             return None
+
+    @staticmethod
+    def _blacklist_key(token: str) -> str:
+        return f"blacklist:{hashlib.sha256(token.encode()).hexdigest()}"
+
+    @staticmethod
+    async def revoke_token(token: str, expires_at: Optional[int]) -> bool:
+        """Blacklist a token until it would have expired anyway.
+
+        Returns False if the blacklist entry could not be stored, in which case the
+        token is still usable.
+        """
+        ttl = int(expires_at - time.time()) if expires_at else settings.access_token_expire_minutes * 60
+        if ttl <= 0:
+            return True
+        try:
+            await redis_client.setex(AuthService._blacklist_key(token), ttl, "1")
+        except RedisError:
+            logger.exception("Token revocation error")
+            return False
+        return True
+
+    @staticmethod
+    async def is_token_revoked(token: str) -> bool:
+        """Check whether a token has been blacklisted on logout.
+
+        Fails open: if Redis cannot be reached the token is treated as not revoked, so
+        a Redis outage does not log every user out. Logout itself reports failure
+        when it cannot store the blacklist entry.
+        """
+        try:
+            return bool(await redis_client.exists(AuthService._blacklist_key(token)))
+        except RedisError:
+            logger.exception("Token blacklist lookup error")
+            return False
     
     @staticmethod
     async def authenticate_user(email: str, password: str) -> Optional[User]:
         """Authenticate a user with email and password."""
         try:
             # Use Supabase auth
-            response = supabase.auth.sign_in_with_password({
+            response = get_supabase_client().auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -74,18 +137,21 @@ class AuthService:
                     meta_access_token=user_data.user_metadata.get("meta_access_token"),
                     meta_user_id=user_data.user_metadata.get("meta_user_id")
                 )
-        except Exception as e:
-            print(f"Authentication error: {e}")
+        except Exception:
+            logger.exception("Authentication error")
             return None
         
         return None
     
     @staticmethod
     async def create_user(user_data: UserCreate) -> Optional[User]:
-        """Create a new user."""
+        """Create a new user.
+
+        Relies on Supabase rejecting duplicate emails, so no lookup is needed first.
+        """
         try:
             # Create user in Supabase
-            response = supabase.auth.sign_up({
+            response = get_supabase_client().auth.sign_up({
                 "email": user_data.email,
                 "password": user_data.password,
                 "options": {
@@ -98,6 +164,10 @@ class AuthService:
             
             if response.user:
                 user_data = response.user
+                # With email confirmation on, Supabase answers a duplicate sign-up
+                # with an obfuscated user that has no identities
+                if user_data.identities == []:
+                    raise UserAlreadyExistsError(user_data.email)
                 return User(
                     id=user_data.id,
                     email=user_data.email,
@@ -109,8 +179,15 @@ class AuthService:
                     meta_access_token=None,
                     meta_user_id=None
                 )
-        except Exception as e:
-            print(f"User creation error: {e}")
+        except UserAlreadyExistsError:
+            raise
+        except AuthApiError as e:
+            if "already registered" in e.message:
+                raise UserAlreadyExistsError(user_data.email) from e
+            logger.exception("User creation error")
+            return None
+        except Exception:
+            logger.exception("User creation error")
             return None
         
         return None
@@ -120,7 +197,7 @@ class AuthService:
         """Get user by ID."""
         try:
             # Get user from Supabase
-            response = supabase.auth.admin.get_user_by_id(user_id)
+            response = get_supabase_client().auth.admin.get_user_by_id(user_id)
             if response.user:
                 user_data = response.user
                 return User(
@@ -134,33 +211,8 @@ class AuthService:
                     meta_access_token=user_data.user_metadata.get("meta_access_token"),
                     meta_user_id=user_data.user_metadata.get("meta_user_id")
                 )
-        except Exception as e:
-            print(f"Get user error: {e}")
-            return None
-        
-        return None
-    
-    @staticmethod
-    async def get_user_by_email(email: str) -> Optional[User]:
-        """Get user by email."""
-        try:
-            # Get user from Supabase by email
-            response = supabase.auth.admin.list_users()
-            for user in response.users:
-                if user.email == email:
-                    return User(
-                        id=user.id,
-                        email=user.email,
-                        full_name=user.user_metadata.get("full_name"),
-                        role=user.user_metadata.get("role", "user"),
-                        created_at=user.created_at,
-                        updated_at=user.updated_at,
-                        is_active=user.email_confirmed_at is not None,
-                        meta_access_token=user.user_metadata.get("meta_access_token"),
-                        meta_user_id=user.user_metadata.get("meta_user_id")
-                    )
-        except Exception as e:
-            print(f"Get user by email error: {e}")
+        except Exception:
+            logger.exception("Get user error")
             return None
         
         return None
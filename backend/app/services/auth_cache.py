@@ -0,0 +1,40 @@
+"""In-process cache for verified JWT access tokens."""
+
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+
+from .auth import auth_service
+from ..models.user import TokenData
+
+# Decoded tokens are kept well below the access token lifetime
+TOKEN_CACHE_TTL_SECONDS = 60
+
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+
+def _cache_key(token: str) -> bytes:
+    """Derive the cache key for a token so raw tokens are never stored."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def verify_token_cached(token: str) -> Optional[TokenData]:
+    """Verify a JWT token, reusing recently decoded results."""
+    key = _cache_key(token)
+    token_data = _token_cache.get(key)
+    if token_data is not None:
+        return token_data
+
+    token_data = auth_service.verify_token(token)
+    # Only cache tokens that outlive the cache entry, so an expired token is never served
+    if token_data is not None and (
+        token_data.exp is None or token_data.exp - time.time() >= TOKEN_CACHE_TTL_SECONDS
+    ):
+        with _token_cache_lock:
+            _token_cache[key] = token_data
+
+    return token_data
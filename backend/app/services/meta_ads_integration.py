@@ -1,237 +1,262 @@
 """Meta Ads MCP Integration Service."""
 
+import asyncio
 import httpx
-import json
-from typing import Dict, Any, Optional, List
+import numpy as np
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Any, Final, Optional, List
 from ..core.config import settings
 
 
+# Static mock payloads, built once at import; callers must treat them as read-only
+_AD_ACCOUNTS_PAYLOAD: Final[Dict[str, Any]] = {
+    "accounts": [
+        {
+            "id": "act_123456789",
+            "name": "Main Ad Account",
+            "status": "ACTIVE",
+            "currency": "USD",
+            "timezone_name": "America/New_York"
+        },
+        {
+            "id": "act_987654321",
+            "name": "Secondary Account",
+            "status": "ACTIVE",
+            "currency": "USD",
+            "timezone_name": "America/Los_Angeles"
+        }
+    ]
+}
+
+_CAMPAIGNS_PAYLOAD: Final[Dict[str, Any]] = {
+    "campaigns": [
+        {
+            "id": "123456789",
+            "name": "Summer Sale Campaign",
+            "status": "ACTIVE",
+            "objective": "CONVERSIONS",
+            "daily_budget": 10000,  # in cents
+            "lifetime_budget": 0,
+            "spend": 2450,
+            "impressions": 125000,
+            "clicks": 3200,
+            "ctr": 2.56,
+            "cpc": 0.77
+        },
+        {
+            "id": "987654321",
+            "name": "Brand Awareness",
+            "status": "PAUSED",
+            "objective": "BRAND_AWARENESS",
+            "daily_budget": 5000,
+            "lifetime_budget": 0,
+            "spend": 1890,
+            "impressions": 89000,
+            "clicks": 1200,
+            "ctr": 1.35,
+            "cpc": 1.58
+        },
+        {
+            "id": "456789123",
+            "name": "Lead Generation",
+            "status": "ACTIVE",
+            "objective": "LEAD_GENERATION",
+            "daily_budget": 7500,
+            "lifetime_budget": 0,
+            "spend": 3200,
+            "impressions": 156000,
+            "clicks": 4100,
+            "ctr": 2.63,
+            "cpc": 0.78
+        }
+    ]
+}
+
+
+@lru_cache(maxsize=32)
+def _mock_insights_payload(since: str, days: int) -> Dict[str, Any]:
+    """Build a mock daily insights series of `days` rows starting at `since`."""
+    dates = (np.datetime64(since, "D") + np.arange(days)).astype(str)
+    spend = 100 + np.arange(days) * 10
+    impressions = spend * 50
+    clicks = spend * 3 // 2
+    return {
+        "insights": [
+            {
+                "date": date,
+                "spend": day_spend,
+                "impressions": day_impressions,
+                "clicks": day_clicks,
+                "ctr": 3.0,
+                "cpc": 0.67,
+                "cpm": 20.0
+            }
+            for date, day_spend, day_impressions, day_clicks in zip(
+                dates.tolist(), spend.tolist(), impressions.tolist(), clicks.tolist()
+            )
+        ]
+    }
+
+
+_ADSETS_PAYLOAD: Final[Dict[str, Any]] = {
+    "adsets": [
+        {
+            "id": "123456789",
+            "name": "Ad Set 1",
+            "status": "ACTIVE",
+            "campaign_id": "123456789",
+            "daily_budget": 5000,
+            "lifetime_budget": 0,
+            "targeting": {
+                "age_min": 25,
+                "age_max": 45,
+                "genders": [1, 2],
+                "geo_locations": {
+                    "countries": ["US"]
+                }
+            }
+        }
+    ]
+}
+
+_ADS_PAYLOAD: Final[Dict[str, Any]] = {
+    "ads": [
+        {
+            "id": "123456789",
+            "name": "Ad 1",
+            "status": "ACTIVE",
+            "adset_id": "123456789",
+            "creative": {
+                "id": "123456789",
+                "title": "Summer Sale - 50% Off!",
+                "body": "Don't miss out on our biggest sale of the year",
+                "image_url": "https://example.com/image.jpg"
+            }
+        }
+    ]
+}
+
+# Recommendation message templates
+_LOW_CTR_TMPL: Final[str] = (
+    "Campaign '{name}' has a low CTR of {ctr}%. "
+    "Consider improving ad creative or targeting."
+)
+_HIGH_SPEND_TMPL: Final[str] = (
+    "Campaign '{name}' has spent ${spend:.2f}. "
+    "Consider reviewing performance and adjusting budget if needed."
+)
+
+
 class MetaAdsMCPIntegration:
     """Integration service for Meta Ads MCP tools."""
     
     def __init__(self):
         self.base_url = "http://localhost:8000"  # Your MCP server URL
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # One pooled HTTP/2 client for the lifetime of the process; pool and HTTP/2
+        # settings live on the transport because a custom transport overrides them
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                retries=2
+            )
+        )
+        # MCP tool name -> handler
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            "mcp_meta_ads_get_ad_accounts": self._mock_get_ad_accounts,
+            "mcp_meta_ads_get_campaigns": self._mock_get_campaigns,
+            "mcp_meta_ads_get_insights": self._mock_get_insights,
+            "mcp_meta_ads_get_adsets": self._mock_get_adsets,
+            "mcp_meta_ads_get_ads": self._mock_get_ads,
+        }
     
     async def call_mcp_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Call a Meta Ads MCP tool."""
         try:
             # This is a mock implementation - replace with actual MCP tool calls
             # In a real implementation, you would call your MCP server directly
-            
-            if tool_name == "mcp_meta_ads_get_ad_accounts":
-                return await self._mock_get_ad_accounts(params)
-            elif tool_name == "mcp_meta_ads_get_campaigns":
-                return await self._mock_get_campaigns(params)
-            elif tool_name == "mcp_meta_ads_get_insights":
-                return await self._mock_get_insights(params)
-            elif tool_name == "mcp_meta_ads_get_adsets":
-                return await self._mock_get_adsets(params)
-            elif tool_name == "mcp_meta_ads_get_ads":
-                return await self._mock_get_ads(params)
-            else:
+            handler = self._dispatch.get(tool_name)
+            if handler is None:
                 raise ValueError(f"Unknown MCP tool: {tool_name}")
+            return await handler(params)
                 
         except Exception as e:
             return {"error": str(e)}
     
     async def _mock_get_ad_accounts(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Mock implementation of get ad accounts."""
-        return {
-            "accounts": [
-                {
-                    "id": "act_123456789",
-                    "name": "Main Ad Account",
-                    "status": "ACTIVE",
-                    "currency": "USD",
-                    "timezone_name": "America/New_York"
-                },
-                {
-                    "id": "act_987654321",
-                    "name": "Secondary Account",
-                    "status": "ACTIVE",
-                    "currency": "USD",
-                    "timezone_name": "America/Los_Angeles"
-                }
-            ]
-        }
+        return _AD_ACCOUNTS_PAYLOAD
     
     async def _mock_get_campaigns(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Mock implementation of get campaigns."""
-        return {
-            "campaigns": [
-                {
-                    "id": "123456789",
-                    "name": "Summer Sale Campaign",
-                    "status": "ACTIVE",
-                    "objective": "CONVERSIONS",
-                    "daily_budget": 10000,  # in cents
-                    "lifetime_budget": 0,
-                    "spend": 2450,
-                    "impressions": 125000,
-                    "clicks": 3200,
-                    "ctr": 2.56,
-                    "cpc": 0.77
-                },
-                {
-                    "id": "987654321",
-                    "name": "Brand Awareness",
-                    "status": "PAUSED",
-                    "objective": "BRAND_AWARENESS",
-                    "daily_budget": 5000,
-                    "lifetime_budget": 0,
-                    "spend": 1890,
-                    "impressions": 89000,
-                    "clicks": 1200,
-                    "ctr": 1.35,
-                    "cpc": 1.58
-                },
-                {
-                    "id": "456789123",
-                    "name": "Lead Generation",
-                    "status": "ACTIVE",
-                    "objective": "LEAD_GENERATION",
-                    "daily_budget": 7500,
-                    "lifetime_budget": 0,
-                    "spend": 3200,
-                    "impressions": 156000,
-                    "clicks": 4100,
-                    "ctr": 2.63,
-                    "cpc": 0.78
-                }
-            ]
-        }
+        return _CAMPAIGNS_PAYLOAD
     
     async def _mock_get_insights(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Mock implementation of get insights."""
-        return {
-            "insights": [
-                {
-                    "date": "2024-01-01",
-                    "spend": 100,
-                    "impressions": 5000,
-                    "clicks": 150,
-                    "ctr": 3.0,
-                    "cpc": 0.67,
-                    "cpm": 20.0
-                },
-                {
-                    "date": "2024-01-02",
-                    "spend": 120,
-                    "impressions": 6000,
-                    "clicks": 180,
-                    "ctr": 3.0,
-                    "cpc": 0.67,
-                    "cpm": 20.0
-                },
-                {
-                    "date": "2024-01-03",
-                    "spend": 110,
-                    "impressions": 5500,
-                    "clicks": 165,
-                    "ctr": 3.0,
-                    "cpc": 0.67,
-                    "cpm": 20.0
-                },
-                {
-                    "date": "2024-01-04",
-                    "spend": 130,
-                    "impressions": 6500,
-                    "clicks": 195,
-                    "ctr": 3.0,
-                    "cpc": 0.67,
-                    "cpm": 20.0
-                },
-                {
-                    "date": "2024-01-05",
-                    "spend": 140,
-                    "impressions": 7000,
-                    "clicks": 210,
-                    "ctr": 3.0,
-                    "cpc": 0.67,
-                    "cpm": 20.0
-                }
-            ]
-        }
+        days = max(1, min(int(params.get("days", 5)), 365))
+        return _mock_insights_payload(params.get("since", "2024-01-01"), days)
     
     async def _mock_get_adsets(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Mock implementation of get ad sets."""
-        return {
-            "adsets": [
-                {
-                    "id": "123456789",
-                    "name": "Ad Set 1",
-                    "status": "ACTIVE",
-                    "campaign_id": "123456789",
-                    "daily_budget": 5000,
-                    "lifetime_budget": 0,
-                    "targeting": {
-                        "age_min": 25,
-                        "age_max": 45,
-                        "genders": [1, 2],
-                        "geo_locations": {
-                            "countries": ["US"]
-                        }
-                    }
-                }
-            ]
-        }
+        return _ADSETS_PAYLOAD
     
     async def _mock_get_ads(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Mock implementation of get ads."""
-        return {
-            "ads": [
-                {
-                    "id": "123456789",
-                    "name": "Ad 1",
-                    "status": "ACTIVE",
-                    "adset_id": "123456789",
-                    "creative": {
-                        "id": "123456789",
-                        "title": "Summer Sale - 50% Off!",
-                        "body": "Don't miss out on our biggest sale of the year",
-                        "image_url": "https://example.com/image.jpg"
-                    }
-                }
-            ]
-        }
+        return _ADS_PAYLOAD
     
     async def get_ai_recommendations(self, campaign_data: Dict[str, Any]) -> List[str]:
         """Generate AI recommendations based on campaign data."""
+        # CPU-bound; run off the event loop so it can overlap other work
+        return await asyncio.to_thread(self._build_recommendations, campaign_data)
+    
+    async def generate_chart_data(self, data_type: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Generate chart data for visualization."""
+        return await asyncio.to_thread(self._build_chart_data, data_type, data)
+    
+    def _build_recommendations(self, campaign_data: Dict[str, Any]) -> List[str]:
+        """Score campaigns against the recommendation thresholds."""
         recommendations = []
         
         campaigns = campaign_data.get("campaigns", [])
+        n = len(campaigns)
+        
+        # Evaluate the thresholds for all campaigns at once; only flagged rows are formatted
+        ctr = np.fromiter((c.get("ctr", 0) for c in campaigns), dtype=np.float64, count=n)
+        spend = np.fromiter((c.get("spend", 0) for c in campaigns), dtype=np.float64, count=n)
+        active = np.fromiter((c.get("status", "") == "ACTIVE" for c in campaigns), dtype=np.bool_, count=n)
+        low_ctr = ctr < 1.5
+        high_spend = (spend > 2000) & active
         
-        for campaign in campaigns:
-            ctr = campaign.get("ctr", 0)
-            spend = campaign.get("spend", 0)
-            status = campaign.get("status", "")
+        for i in np.flatnonzero(low_ctr | high_spend):
+            campaign = campaigns[i]
             
-            if ctr < 1.5:
+            if low_ctr[i]:
                 recommendations.append(
-                    f"Campaign '{campaign['name']}' has a low CTR of {ctr}%. "
-                    "Consider improving ad creative or targeting."
+                    _LOW_CTR_TMPL.format(name=campaign["name"], ctr=campaign.get("ctr", 0))
                 )
             
-            if spend > 2000 and status == "ACTIVE":
+            if high_spend[i]:
                 recommendations.append(
-                    f"Campaign '{campaign['name']}' has spent ${spend/100:.2f}. "
-                    "Consider reviewing performance and adjusting budget if needed."
+                    _HIGH_SPEND_TMPL.format(name=campaign["name"], spend=campaign.get("spend", 0) / 100)
                 )
         
         return recommendations
     
-    async def generate_chart_data(self, data_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate chart data for visualization."""
+    def _build_chart_data(self, data_type: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build a Chart.js config for the given data type."""
         if data_type == "spend_trend":
             insights = data.get("insights", [])
+            # Spend is converted from cents in one vectorized divide
+            spend = np.fromiter((insight["spend"] for insight in insights), dtype=np.float64, count=len(insights))
             return {
                 "type": "line",
                 "data": {
                     "labels": [insight["date"] for insight in insights],
                     "datasets": [{
                         "label": "Daily Spend ($)",
-                        "data": [insight["spend"] / 100 for insight in insights],
+                        "data": (spend / 100).tolist(),
                         "borderColor": "rgb(59, 130, 246)",
                         "backgroundColor": "rgba(59, 130, 246, 0.1)",
                         "tension": 0.1
@@ -250,6 +275,7 @@ class MetaAdsMCPIntegration:
         
         elif data_type == "campaign_performance":
             campaigns = data.get("campaigns", [])
+            spend = np.fromiter((campaign["spend"] for campaign in campaigns), dtype=np.float64, count=len(campaigns))
             return {
                 "type": "bar",
                 "data": {
@@ -264,7 +290,7 @@ class MetaAdsMCPIntegration:
                         },
                         {
                             "label": "Spend ($)",
-                            "data": [campaign["spend"] / 100 for campaign in campaigns],
+                            "data": (spend / 100).tolist(),
                             "backgroundColor": "rgba(59, 130, 246, 0.8)",
                             "borderColor": "rgb(59, 130, 246)",
                             "borderWidth": 1
@@ -283,6 +309,10 @@ class MetaAdsMCPIntegration:
             }
         
         return None
+    
+    async def close(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
 
 
 # Global instance
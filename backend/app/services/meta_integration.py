@@ -1,11 +1,175 @@
 """Meta Ads API Integration Service."""
 
+import functools
+import hashlib
+import logging
+from pathlib import Path
 import httpx
-import json
+import orjson
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable, Coroutine
 from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from cachetools import TTLCache
+from redis.exceptions import RedisError
 from ..core.config import settings
+from ..core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Maximum sub-requests Graph accepts in one batch call
+GRAPH_BATCH_LIMIT = 50
+
+# Response cache lifetimes in seconds, by how quickly each object type changes.
+# Campaign writes invalidate through a per-token generation counter; for other
+# objects these also bound how long a change can look stale.
+ACCOUNTS_CACHE_TTL = 300
+OBJECTS_CACHE_TTL = 60
+REALTIME_CACHE_TTL = 15
+# Idle lifetime of a generation counter; must outlive the entries it versions
+GENERATION_TTL = 86400
+# In-process caches in front of Redis for data read on every dashboard load
+USER_INFO_MEMO_TTL = 600
+MEMO_MAXSIZE = 1024
+
+# Graph ``fields`` selections, one per object type
+_CAMPAIGN_FIELDS = "id,name,status,objective,daily_budget,lifetime_budget,spend,impressions,clicks,ctr,cpc,created_time,updated_time"
+_INSIGHT_FIELDS = "date_start,date_stop,spend,impressions,clicks,ctr,cpc,cpm,reach,frequency"
+_ADSET_FIELDS = "id,name,status,campaign_id,daily_budget,lifetime_budget,targeting,created_time,updated_time"
+_AD_FIELDS = "id,name,status,adset_id,creative,created_time,updated_time"
+_USER_FIELDS = "id,name,email"
+_ACCOUNT_FIELDS = "id,name,account_status,currency,timezone_name,business_name,account_type"
+
+# Account-level totals read by get_account_performance_summary
+_SUMMARY_FIELDS = "spend,impressions,clicks,ctr,cpc"
+
+# Strategy thresholds used by _analyze_campaign_performance
+_LOW_CTR = 1.0
+_HIGH_CPC = 2.0
+_LOW_REACH = 10000
+_TARGET_CPM = 15.0
+_RULES_TMPL: Dict[str, float] = {
+    "min_ctr": _LOW_CTR,
+    "max_cpc": _HIGH_CPC,
+    "target_cpm": _TARGET_CPM,
+    "budget_threshold": 0.0
+}
+
+_RATE_LIMIT_SCRIPT = Path(__file__).with_name("rate_limit.lua").read_text()
+
+
+def _token_fingerprint(access_token: str) -> str:
+    """Identify an access token in Redis keys without storing the token itself."""
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+
+def _graph_guard(default: Callable[[], Any]):
+    """Turn HTTP and decoding failures from Graph into the method's empty result.
+
+    Other errors propagate to the caller, and cancellation is never swallowed.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                logger.warning("Meta Graph API call %s failed: %s", func.__name__, e)
+                return default()
+        return wrapper
+    return decorator
+
+
+def _memoized(cache_attr: str):
+    """Serve a getter's non-empty result from a per-instance TTLCache.
+
+    Uses the same positional (object IDs..., access_token) convention as
+    ``_redis_cached`` and sits in front of it, so hits skip Redis and decoding.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args):
+            *object_ids, access_token = args
+            cache: TTLCache = getattr(self, cache_attr)
+            key = (_token_fingerprint(access_token), *object_ids)
+            data = cache.get(key)
+            if data is None:
+                data = await func(self, *args)
+                if data:
+                    cache[key] = data
+            return data
+        return wrapper
+    return decorator
+
+
+def _singleflight(func):
+    """Share one in-flight call among concurrent callers with the same arguments.
+
+    Uses the positional (object IDs..., access_token) convention. The call runs as a
+    task so one caller being cancelled does not cancel it for the others.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args):
+        *object_ids, access_token = args
+        key = (func.__name__, _token_fingerprint(access_token), *object_ids)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(self, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    return wrapper
+
+
+def _generation_key(name: str, access_token: str) -> str:
+    return f"meta:{name}:gen:{_token_fingerprint(access_token)}"
+
+
+async def _bump_generation(name: str, access_token: str) -> None:
+    """Invalidate every ``versioned`` cache entry of ``name`` for this token.
+
+    Called after writes; a failure is logged and entries then expire on their TTL.
+    """
+    key = _generation_key(name, access_token)
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await pipe.incr(key).expire(key, GENERATION_TTL).execute()
+    except RedisError:
+        logger.exception("Meta cache invalidation error")
+
+
+def _redis_cached(name: str, ttl: int, versioned: bool = False):
+    """Cache a getter's non-empty result in Redis.
+
+    The wrapped method must take its object IDs positionally followed by the access
+    token, which is fingerprinted into the key so users never share entries. With
+    ``versioned``, keys also carry the token's generation counter, so
+    ``_bump_generation`` drops all of them at once without knowing their IDs.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args):
+            *object_ids, access_token = args
+            key = f"meta:{name}:{_token_fingerprint(access_token)}:{':'.join(object_ids)}"
+            try:
+                if versioned:
+                    generation = await redis_client.get(_generation_key(name, access_token))
+                    key = f"{key}:v{generation or 0}"
+                cached = await redis_client.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except RedisError:
+                logger.exception("Meta cache read error")
+
+            data = await func(self, *args)
+            if data:
+                try:
+                    await redis_client.set(key, orjson.dumps(data), ex=ttl)
+                except RedisError:
+                    logger.exception("Meta cache write error")
+            return data
+        return wrapper
+    return decorator
 
 
 class MetaIntegrationService:
@@ -15,200 +179,268 @@ class MetaIntegrationService:
         self.app_id = settings.meta_app_id
         self.app_secret = settings.meta_app_secret
         self.base_url = "https://graph.facebook.com/v18.0"
-        self.client = httpx.AsyncClient(timeout=30.0)
-
+        # One pooled HTTP/2 client so concurrent Graph calls share a connection; pool and
+        # HTTP/2 settings live on the transport because a custom transport overrides them
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+            )
+        )
+        self._rl = redis_client.register_script(_RATE_LIMIT_SCRIPT)
+        self._ad_accounts_memo: TTLCache = TTLCache(maxsize=MEMO_MAXSIZE, ttl=ACCOUNTS_CACHE_TTL)
+        self._user_info_memo: TTLCache = TTLCache(maxsize=MEMO_MAXSIZE, ttl=USER_INFO_MEMO_TTL)
+        # (method, token fingerprint, object IDs...) -> in-flight read shared by callers
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> Any:
+        """Decode a Graph API response body with orjson."""
+        return orjson.loads(response.content)
+
+    async def _throttled(
+        self, request: Coroutine[Any, Any, httpx.Response], access_token: str, cost: int = 1
+    ) -> httpx.Response:
+        """Send a Graph request once the token's shared rate-limit bucket allows it.
+
+        If Redis is unavailable the request is sent unthrottled.
+        """
+        key = f"meta:rl:{_token_fingerprint(access_token)}"
+        try:
+            while True:
+                allowed, retry_after = await self._rl(keys=[key], args=[
+                    settings.meta_rate_limit_capacity,
+                    settings.meta_rate_limit_refill_per_second,
+                    # A request larger than the bucket could never be admitted
+                    min(cost, settings.meta_rate_limit_capacity)
+                ])
+                if int(allowed):
+                    break
+                await asyncio.sleep(float(retry_after))
+        except RedisError:
+            logger.exception("Meta rate limiter error")
+        except BaseException:
+            request.close()
+            raise
+        return await request
+
+    async def _get_json(self, url: str, params: Any, access_token: str) -> Dict[str, Any]:
+        """GET a Graph path and decode the body, raising on a non-2xx status."""
+        response = await self._throttled(self.client.get(url, params=params), access_token)
+        response.raise_for_status()
+        return self._parse(response)
+
+    async def _paginated(self, url: str, params: Any, access_token: str) -> List[Dict[str, Any]]:
+        """Collect the ``data`` of every page of a Graph edge, following ``paging.next``.
+
+        Raises if any page fails, so a truncated edge is never returned.
+        """
+        out = []
+        while url:
+            page = await self._get_json(url, params, access_token)
+            out.extend(page.get("data", []))
+            # The next-page URL is absolute and already carries the token and fields
+            url, params = page.get("paging", {}).get("next"), None
+        return out
+
+    async def _graph_batch(self, access_token: str, requests: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Run Graph API requests through the batch endpoint, 50 per call.
+
+        Returns the decoded body of each sub-request in order, or None where it failed.
+        """
+        chunks = [requests[i:i + GRAPH_BATCH_LIMIT] for i in range(0, len(requests), GRAPH_BATCH_LIMIT)]
+        # Graph counts every sub-request against the rate limit, so each chunk costs its size
+        responses = await asyncio.gather(*(
+            self._throttled(self.client.post(
+                "/",
+                data={"access_token": access_token, "batch": orjson.dumps(chunk).decode()}
+            ), access_token, cost=len(chunk))
+            for chunk in chunks
+        ))
+
+        results = []
+        for chunk, response in zip(chunks, responses):
+            if response.status_code != 200:
+                results.extend([None] * len(chunk))
+                continue
+            for sub_response in self._parse(response):
+                if sub_response and sub_response.get("code") == 200:
+                    results.append(orjson.loads(sub_response["body"]))
+                else:
+                    results.append(None)
+        return results
+
+    @_graph_guard(bool)
     async def validate_access_token(self, access_token: str) -> bool:
         """Validate Meta access token."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/me",
+        response = await self._throttled(
+            self.client.get(
+                "/me",
                 params={"access_token": access_token}
-            )
-            return response.status_code == 200 and not response.json().get("error")
-        except Exception:
-            return False
-
+            ),
+            access_token
+        )
+        # Graph reports token errors with a 4xx status, so the body need not be decoded
+        return response.status_code == 200
+
+    @_memoized("_user_info_memo")
+    @_singleflight
+    @_graph_guard(lambda: None)
     async def get_user_info(self, access_token: str) -> Optional[Dict[str, Any]]:
         """Get user information from Meta."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/me",
-                params={
-                    "access_token": access_token,
-                    "fields": "id,name,email"
-                }
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception:
-            return None
-
+        return await self._get_json(
+            "/me",
+            (("access_token", access_token), ("fields", _USER_FIELDS)),
+            access_token
+        )
+
+    @_memoized("_ad_accounts_memo")
+    @_singleflight
+    @_redis_cached("ad_accounts", ACCOUNTS_CACHE_TTL)
+    @_graph_guard(list)
     async def get_ad_accounts(self, access_token: str) -> List[Dict[str, Any]]:
         """Get user's ad accounts."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/me/adaccounts",
-                params={
-                    "access_token": access_token,
-                    "fields": "id,name,account_status,currency,timezone_name,business_name,account_type"
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            return []
-        except Exception:
-            return []
-
+        return await self._paginated(
+            "/me/adaccounts",
+            (("access_token", access_token), ("fields", _ACCOUNT_FIELDS)),
+            access_token
+        )
+
+    @_singleflight
+    @_redis_cached("campaigns", OBJECTS_CACHE_TTL, versioned=True)
+    @_graph_guard(list)
     async def get_campaigns(self, account_id: str, access_token: str) -> List[Dict[str, Any]]:
         """Get campaigns for an ad account."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/{account_id}/campaigns",
-                params={
-                    "access_token": access_token,
-                    "fields": "id,name,status,objective,daily_budget,lifetime_budget,spend,impressions,clicks,ctr,cpc,created_time,updated_time"
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            return []
-        except Exception:
-            return []
+        return await self._paginated(
+            f"/{account_id}/campaigns",
+            (("access_token", access_token), ("fields", _CAMPAIGN_FIELDS)),
+            access_token
+        )
 
+    @_graph_guard(list)
     async def get_insights(self, object_id: str, access_token: str, date_range: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """Get insights for a campaign, ad set, or ad."""
-        try:
-            params = {
-                "access_token": access_token,
-                "fields": "date_start,date_stop,spend,impressions,clicks,ctr,cpc,cpm,reach,frequency"
-            }
+        params = (("access_token", access_token), ("fields", _INSIGHT_FIELDS))
 
-            if date_range:
-                params["date_preset"] = "custom"
-                params["time_range"] = json.dumps({
+        if date_range:
+            params += (
+                ("date_preset", "custom"),
+                ("time_range", orjson.dumps({
                     "since": date_range["start"],
                     "until": date_range["end"]
-                })
-            else:
-                params["date_preset"] = "last_30d"
-
-            response = await self.client.get(
-                f"{self.base_url}/{object_id}/insights",
-                params=params
+                }).decode())
             )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            return []
-        except Exception:
-            return []
+        else:
+            params += (("date_preset", "last_30d"),)
+
+        return await self._paginated(f"/{object_id}/insights", params, access_token)
 
+    @_singleflight
+    @_redis_cached("adsets", OBJECTS_CACHE_TTL)
+    @_graph_guard(list)
     async def get_ad_sets(self, campaign_id: str, access_token: str) -> List[Dict[str, Any]]:
         """Get ad sets for a campaign."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/{campaign_id}/adsets",
-                params={
-                    "access_token": access_token,
-                    "fields": "id,name,status,campaign_id,daily_budget,lifetime_budget,targeting,created_time,updated_time"
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            return []
-        except Exception:
-            return []
-
+        return await self._paginated(
+            f"/{campaign_id}/adsets",
+            (("access_token", access_token), ("fields", _ADSET_FIELDS)),
+            access_token
+        )
+
+    @_singleflight
+    @_redis_cached("ads", OBJECTS_CACHE_TTL)
+    @_graph_guard(list)
     async def get_ads(self, adset_id: str, access_token: str) -> List[Dict[str, Any]]:
         """Get ads for an ad set."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/{adset_id}/ads",
-                params={
-                    "access_token": access_token,
-                    "fields": "id,name,status,adset_id,creative,created_time,updated_time"
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            return []
-        except Exception:
-            return []
+        return await self._paginated(
+            f"/{adset_id}/ads",
+            (("access_token", access_token), ("fields", _AD_FIELDS)),
+            access_token
+        )
 
+    @_graph_guard(bool)
     async def update_campaign_status(self, campaign_id: str, access_token: str, status: str) -> bool:
         """Update campaign status."""
-        try:
-            response = await self.client.post(
-                f"{self.base_url}/{campaign_id}",
+        response = await self._throttled(
+            self.client.post(
+                f"/{campaign_id}",
                 params={"access_token": access_token},
-                data={"status": status}
-            )
-            return response.status_code == 200
-        except Exception:
-            return False
-
+                json={"status": status}
+            ),
+            access_token
+        )
+        response.raise_for_status()
+        await _bump_generation("campaigns", access_token)
+        return True
+
+    @_graph_guard(bool)
     async def update_campaign_budget(self, campaign_id: str, access_token: str, daily_budget: int) -> bool:
         """Update campaign daily budget."""
-        try:
-            response = await self.client.post(
-                f"{self.base_url}/{campaign_id}",
+        response = await self._throttled(
+            self.client.post(
+                f"/{campaign_id}",
                 params={"access_token": access_token},
-                data={"daily_budget": daily_budget}
-            )
-            return response.status_code == 200
-        except Exception:
-            return False
-
+                json={"daily_budget": daily_budget}
+            ),
+            access_token
+        )
+        response.raise_for_status()
+        await _bump_generation("campaigns", access_token)
+        return True
+
+    @_singleflight
+    @_redis_cached("realtime", REALTIME_CACHE_TTL)
+    @_graph_guard(list)
     async def get_realtime_insights(self, account_id: str, access_token: str) -> List[Dict[str, Any]]:
         """Get real-time insights for an account."""
-        try:
-            # Get today's insights
-            today = datetime.now().strftime("%Y-%m-%d")
-            response = await self.client.get(
-                f"{self.base_url}/{account_id}/insights",
-                params={
-                    "access_token": access_token,
-                    "fields": "date_start,date_stop,spend,impressions,clicks,ctr,cpc,cpm,reach,frequency",
-                    "date_preset": "today"
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            return []
-        except Exception:
-            return []
-
+        # date_preset=today lets Graph resolve "today" in the account's timezone
+        data = await self._get_json(
+            f"/{account_id}/insights",
+            (("access_token", access_token), ("fields", _INSIGHT_FIELDS), ("date_preset", "today")),
+            access_token
+        )
+        return data.get("data", [])
+
+    @_singleflight
+    @_graph_guard(list)
     async def generate_optimization_strategies(self, account_id: str, access_token: str) -> List[Dict[str, Any]]:
         """Generate optimization strategies based on account performance."""
-        try:
-            # Get campaigns and their insights
-            campaigns = await self.get_campaigns(account_id, access_token)
-            strategies = []
-
-            for campaign in campaigns:
-                if campaign.get("status") == "ACTIVE":
-                    insights = await self.get_insights(campaign["id"], access_token, {
-                        "start": (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d"),
-                        "end": datetime.now().strftime("%Y-%m-%d")
-                    })
-
-                    if insights:
-                        latest_insight = insights[0]
-                        strategy = self._analyze_campaign_performance(campaign, latest_insight)
-                        strategies.append(strategy)
-
-            return strategies
-        except Exception:
-            return []
-
-    def _analyze_campaign_performance(self, campaign: Dict[str, Any], insight: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze campaign performance and generate optimization strategy."""
+        # Get campaigns and their insights
+        campaigns = await self.get_campaigns(account_id, access_token)
+        active = [c for c in campaigns if c.get("status") == "ACTIVE"]
+        now = datetime.now()
+        now_iso = now.isoformat()
+        time_range = orjson.dumps({
+            "since": (now - timedelta(days=7)).strftime("%Y-%m-%d"),
+            "until": now.strftime("%Y-%m-%d")
+        }).decode()
+        query = urlencode({
+            "fields": _INSIGHT_FIELDS,
+            "time_range": time_range
+        })
+
+        # Fetch insights for all active campaigns through the Graph batch endpoint
+        bodies = await self._graph_batch(access_token, [
+            {"method": "GET", "relative_url": f"{c['id']}/insights?{query}"} for c in active
+        ])
+        results = [body.get("data", []) if body else [] for body in bodies]
+
+        strategies = []
+        for campaign, insights in zip(active, results):
+            if not insights:
+                continue
+            latest_insight = insights[0]
+            strategy = self._analyze_campaign_performance(campaign, latest_insight, now_iso)
+            strategies.append(strategy)
+
+        return strategies
+
+    def _analyze_campaign_performance(self, campaign: Dict[str, Any], insight: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Analyze campaign performance and generate optimization strategy.
+
+        ``now_iso`` is the caller's timestamp, shared by every strategy in one run.
+        """
         spend = float(insight.get("spend", 0))
         impressions = int(insight.get("impressions", 0))
         clicks = int(insight.get("clicks", 0))
@@ -216,10 +448,8 @@ class MetaIntegrationService:
         cpc = float(insight.get("cpc", 0))
         cpm = float(insight.get("cpm", 0))
 
-        # Define thresholds
-        low_ctr_threshold = 1.0
-        high_cpc_threshold = 2.0
-        low_reach_threshold = 10000
+        rules = _RULES_TMPL.copy()
+        rules["budget_threshold"] = float(campaign.get("daily_budget", 0)) * 0.8
 
         # Generate strategy
         strategy = {
@@ -227,17 +457,12 @@ class MetaIntegrationService:
             "campaign_name": campaign["name"],
             "type": "performance_optimization",
             "status": "active",
-            "rules": {
-                "min_ctr": low_ctr_threshold,
-                "max_cpc": high_cpc_threshold,
-                "target_cpm": 15.0,
-                "budget_threshold": float(campaign.get("daily_budget", 0)) * 0.8
-            },
+            "rules": rules,
             "actions": {
-                "pause_low_performing": ctr < low_ctr_threshold,
+                "pause_low_performing": ctr < _LOW_CTR,
                 "increase_budget": cpc < 1.5 and ctr > 2.0,
-                "adjust_bidding": cpc > high_cpc_threshold,
-                "expand_audience": int(insight.get("reach", 0)) < low_reach_threshold
+                "adjust_bidding": cpc > _HIGH_CPC,
+                "expand_audience": int(insight.get("reach", 0)) < _LOW_REACH
             },
             "performance_metrics": {
                 "spend": spend,
@@ -247,62 +472,114 @@ class MetaIntegrationService:
                 "cpc": cpc,
                 "cpm": cpm
             },
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
 
         return strategy
 
-    async def execute_strategy(self, strategy: Dict[str, Any], access_token: str) -> bool:
-        """Execute an optimization strategy."""
-        try:
-            campaign_id = strategy["campaign_id"]
-            actions = strategy["actions"]
-
-            if actions.get("pause_low_performing"):
-                await self.update_campaign_status(campaign_id, access_token, "PAUSED")
-
-            if actions.get("increase_budget"):
-                current_budget = float(strategy.get("performance_metrics", {}).get("spend", 0))
-                new_budget = int(current_budget * 1.2 * 100)  # Increase by 20%
-                await self.update_campaign_budget(campaign_id, access_token, new_budget)
+    @_graph_guard(bool)
+    async def _bulk_update(self, updates: List[Tuple[str, Dict[str, Any]]], access_token: str) -> bool:
+        """Apply (object_id, fields) updates through the Graph batch endpoint.
 
+        Returns True only if every update succeeded.
+        """
+        if not updates:
             return True
-        except Exception:
-            return False
+        bodies = await self._graph_batch(access_token, [
+            {"method": "POST", "relative_url": object_id, "body": urlencode(fields)}
+            for object_id, fields in updates
+        ])
+        # Some sub-requests may have applied even if others failed
+        await _bump_generation("campaigns", access_token)
+        return all(body is not None for body in bodies)
 
-    async def get_account_performance_summary(self, account_id: str, access_token: str) -> Dict[str, Any]:
-        """Get a summary of account performance."""
-        try:
-            campaigns = await self.get_campaigns(account_id, access_token)
-            total_spend = 0
-            total_impressions = 0
-            total_clicks = 0
-            active_campaigns = 0
-
-            for campaign in campaigns:
-                if campaign.get("status") == "ACTIVE":
-                    active_campaigns += 1
-                    total_spend += float(campaign.get("spend", 0))
-                    total_impressions += int(campaign.get("impressions", 0))
-                    total_clicks += int(campaign.get("clicks", 0))
-
-            avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-            avg_cpc = (total_spend / total_clicks) if total_clicks > 0 else 0
-
-            return {
-                "account_id": account_id,
-                "total_campaigns": len(campaigns),
-                "active_campaigns": active_campaigns,
-                "total_spend": total_spend,
-                "total_impressions": total_impressions,
-                "total_clicks": total_clicks,
-                "average_ctr": avg_ctr,
-                "average_cpc": avg_cpc,
-                "last_updated": datetime.now().isoformat()
+    async def execute_strategy(self, strategy: Dict[str, Any], access_token: str) -> bool:
+        """Execute an optimization strategy."""
+        campaign_id = strategy["campaign_id"]
+        actions = strategy["actions"]
+        # All of a campaign's changes go out together as one batched update
+        fields: Dict[str, Any] = {}
+
+        if actions.get("pause_low_performing"):
+            fields["status"] = "PAUSED"
+
+        if actions.get("increase_budget"):
+            current_budget = float(strategy.get("performance_metrics", {}).get("spend", 0))
+            fields["daily_budget"] = int(current_budget * 1.2 * 100)  # Increase by 20%
+
+        return await self._bulk_update([(campaign_id, fields)] if fields else [], access_token)
+
+    @_singleflight
+    @_graph_guard(dict)
+    async def get_account_overview(self, account_id: str, access_token: str) -> Dict[str, Any]:
+        """Get an account's campaigns and last-30-day insights in one Graph batch call.
+
+        Campaign lists longer than one page need follow-up requests for the remaining pages.
+        """
+        campaigns_body, insights_body = await self._graph_batch(access_token, [
+            {
+                "method": "GET",
+                "relative_url": f"{account_id}/campaigns?" + urlencode({
+                    "fields": _CAMPAIGN_FIELDS
+                })
+            },
+            {
+                "method": "GET",
+                "relative_url": f"{account_id}/insights?" + urlencode({
+                    "fields": _INSIGHT_FIELDS,
+                    "date_preset": "last_30d"
+                })
             }
-        except Exception:
-            return {}
+        ])
+        campaigns_body = campaigns_body or {}
+        campaigns = campaigns_body.get("data", [])
+        next_page = campaigns_body.get("paging", {}).get("next")
+        if next_page:
+            # The batch only returns the first page; fetch the rest directly
+            campaigns += await self._paginated(next_page, None, access_token)
+
+        return {
+            "account_id": account_id,
+            "campaigns": campaigns,
+            "insights": insights_body.get("data", []) if insights_body else []
+        }
+
+    @_singleflight
+    @_graph_guard(dict)
+    async def get_account_performance_summary(self, account_id: str, access_token: str) -> Dict[str, Any]:
+        """Get a summary of account performance.
+
+        Totals come pre-aggregated from Graph's account-level insights rather than
+        being summed over campaigns here.
+        """
+        campaigns, insights = await asyncio.gather(
+            self.get_campaigns(account_id, access_token),
+            self._get_json(
+                f"/{account_id}/insights",
+                (
+                    ("access_token", access_token),
+                    ("fields", _SUMMARY_FIELDS),
+                    ("date_preset", "last_30d"),
+                    ("level", "account")
+                ),
+                access_token
+            )
+        )
+        # No row means no delivery in the window
+        totals = (insights.get("data") or [{}])[0]
+
+        return {
+            "account_id": account_id,
+            "total_campaigns": len(campaigns),
+            "active_campaigns": sum(1 for c in campaigns if c.get("status") == "ACTIVE"),
+            "total_spend": float(totals.get("spend", 0)),
+            "total_impressions": int(totals.get("impressions", 0)),
+            "total_clicks": int(totals.get("clicks", 0)),
+            "average_ctr": float(totals.get("ctr", 0)),
+            "average_cpc": float(totals.get("cpc", 0)),
+            "last_updated": datetime.now().isoformat()
+        }
 
     async def close(self):
         """Close the HTTP client."""
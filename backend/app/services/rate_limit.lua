@@ -0,0 +1,34 @@
+-- Token bucket shared by every worker calling the Meta Graph API.
+-- KEYS[1]: bucket key
+-- ARGV: capacity, refill_rate (tokens per second), requested
+-- Returns {allowed (0/1), retry_after seconds as a string}
+
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+-- Use the Redis server clock so workers with skewed clocks share one timeline
+-- (allowed before writes under effects replication, the default since Redis 5)
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill_rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= requested then
+    tokens = tokens - requested
+    allowed = 1
+else
+    retry_after = (requested - tokens) / refill_rate
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens, "ts", now)
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / refill_rate) + 1)
+
+-- Lua numbers are truncated to integers on return, so send the delay as a string
+return {allowed, tostring(retry_after)}
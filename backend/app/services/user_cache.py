@@ -0,0 +1,49 @@
+"""Redis-backed cache for authenticated user profiles."""
+
+import logging
+from typing import Optional
+from redis.exceptions import RedisError
+from ..core.config import settings
+from ..core.redis import redis_client
+from ..models.user import User
+from .auth import auth_service
+
+logger = logging.getLogger(__name__)
+
+
+class UserCacheService:
+    """Cache-aside lookup of users in front of Supabase."""
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"user:{user_id}"
+
+    async def get(self, user_id: str) -> Optional[User]:
+        """Get a user by ID, serving from Redis when possible."""
+        key = self._key(user_id)
+        try:
+            cached = await redis_client.get(key)
+            if cached is not None:
+                return User.model_validate_json(cached)
+        except RedisError:
+            logger.exception("User cache read error")
+
+        user = await auth_service.get_user_by_id(user_id)
+        if user is not None:
+            try:
+                await redis_client.setex(key, settings.user_cache_ttl_seconds, user.model_dump_json())
+            except RedisError:
+                logger.exception("User cache write error")
+
+        return user
+
+    async def invalidate(self, user_id: str) -> None:
+        """Drop a cached user; call after any change to the user's profile."""
+        try:
+            await redis_client.delete(self._key(user_id))
+        except RedisError:
+            logger.exception("User cache invalidation error")
+
+
+# Global user cache service instance
+user_cache_service = UserCacheService()
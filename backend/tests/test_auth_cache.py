@@ -0,0 +1,75 @@
+"""Tests for the in-process verified-token cache."""
+
+import time
+
+import pytest
+
+from app.models.user import TokenData
+from app.services import auth_cache
+from app.services.auth_cache import TOKEN_CACHE_TTL_SECONDS, verify_token_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth_cache._token_cache.clear()
+    yield
+    auth_cache._token_cache.clear()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Replace JWT decoding with a stub that records each call and returns ``exp``."""
+    calls = []
+
+    def install(exp):
+        def verify_token(token):
+            calls.append(token)
+            return TokenData(user_id="user-1", exp=exp)
+
+        monkeypatch.setattr(auth_cache.auth_service, "verify_token", verify_token)
+        return calls
+
+    return install
+
+
+def test_long_lived_token_is_decoded_once(decode_calls):
+    calls = decode_calls(int(time.time()) + 3600)
+
+    first = verify_token_cached("token")
+    second = verify_token_cached("token")
+
+    assert first == second
+    assert first.user_id == "user-1"
+    assert calls == ["token"]
+
+
+def test_near_expiry_token_is_never_cached(decode_calls):
+    calls = decode_calls(int(time.time()) + TOKEN_CACHE_TTL_SECONDS // 2)
+
+    verify_token_cached("token")
+    verify_token_cached("token")
+
+    assert calls == ["token", "token"]
+    assert len(auth_cache._token_cache) == 0
+
+
+def test_invalid_token_is_not_cached(monkeypatch):
+    calls = []
+
+    def verify_token(token):
+        calls.append(token)
+        return None
+
+    monkeypatch.setattr(auth_cache.auth_service, "verify_token", verify_token)
+
+    assert verify_token_cached("bad") is None
+    assert verify_token_cached("bad") is None
+    assert calls == ["bad", "bad"]
+
+
+def test_cache_keys_never_contain_the_raw_token(decode_calls):
+    decode_calls(int(time.time()) + 3600)
+
+    verify_token_cached("secret-token")
+
+    assert all(b"secret-token" not in key for key in auth_cache._token_cache)
@@ -0,0 +1,118 @@
+"""Tests for the chat routes' Meta Ads MCP fan-out and error handling."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.chat import routes
+from app.api.chat.routes import analyze_campaigns, send_message
+from app.models.chat import AnalysisRequest, ChatRequest
+from app.models.user import User
+
+USER = User(
+    id="user-1",
+    email="user@example.com",
+    created_at=datetime(2024, 1, 1),
+    updated_at=datetime(2024, 1, 1),
+    meta_access_token="meta-token",
+)
+
+
+@pytest.fixture
+def mcp_calls(monkeypatch):
+    """Record every MCP tool call while still serving the mock payloads."""
+    calls = []
+    call_mcp_tool = routes.meta_ads_integration.call_mcp_tool
+
+    async def spy(tool_name, params):
+        calls.append((tool_name, params))
+        return await call_mcp_tool(tool_name, params)
+
+    monkeypatch.setattr(routes.meta_ads_integration, "call_mcp_tool", spy)
+    return calls
+
+
+def _send(content):
+    return asyncio.run(send_message(ChatRequest(content=content), USER))
+
+
+def test_message_matching_several_categories_fetches_each_once(mcp_calls):
+    result = _send("Show me my campaigns and insights")
+
+    assert sorted(tool for tool, _ in mcp_calls) == [
+        "mcp_meta_ads_get_campaigns",
+        "mcp_meta_ads_get_insights",
+    ]
+    assert {"campaigns", "insights"} <= result["data"].keys()
+    assert all(params["access_token"] == "meta-token" for _, params in mcp_calls)
+
+
+def test_ad_set_phrase_matches_the_adset_category(mcp_calls):
+    _send("list my ad sets")
+
+    assert [tool for tool, _ in mcp_calls] == ["mcp_meta_ads_get_adsets"]
+
+
+def test_message_without_keywords_makes_no_mcp_calls(mcp_calls):
+    result = _send("hello there")
+
+    assert mcp_calls == []
+    assert result["data"] == {}
+
+
+def test_campaign_chart_is_built_alongside_recommendations(mcp_calls):
+    result = _send("show a chart of my campaigns")
+
+    assert result["chart_data"] is not None
+    assert isinstance(result["recommendations"], list)
+
+
+@pytest.fixture
+def mcp_results(monkeypatch):
+    """Answer MCP tool calls from a tool name -> result mapping."""
+    results = {}
+
+    async def call_mcp_tool(tool_name, params):
+        return results[tool_name]
+
+    monkeypatch.setattr(routes.meta_ads_integration, "call_mcp_tool", call_mcp_tool)
+    return results
+
+
+def test_mcp_error_is_reported_as_502(mcp_results):
+    mcp_results["mcp_meta_ads_get_campaigns"] = {"error": "upstream timeout"}
+    mcp_results["mcp_meta_ads_get_insights"] = {"insights": []}
+
+    with pytest.raises(HTTPException) as exc_info:
+        _send("campaigns and insights")
+
+    assert exc_info.value.status_code == 502
+    assert "upstream timeout" in exc_info.value.detail
+
+
+def test_empty_insights_do_not_divide_by_zero(mcp_results):
+    mcp_results["mcp_meta_ads_get_insights"] = {"insights": []}
+
+    result = _send("insights")
+
+    assert result["data"] == {"insights": []}
+
+
+def test_analyze_campaigns_handles_an_account_without_campaigns(mcp_results):
+    mcp_results["mcp_meta_ads_get_campaigns"] = {"campaigns": []}
+
+    result = asyncio.run(analyze_campaigns(AnalysisRequest(account_id="act_1"), USER))
+
+    assert result["analysis"]["total_campaigns"] == 0
+    assert result["analysis"]["avg_ctr"] == 0.0
+
+
+def test_analyze_campaigns_reports_mcp_error_as_502(mcp_results):
+    mcp_results["mcp_meta_ads_get_campaigns"] = {"error": "bad token"}
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(analyze_campaigns(AnalysisRequest(), USER))
+
+    assert exc_info.value.status_code == 502
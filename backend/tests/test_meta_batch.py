@@ -0,0 +1,93 @@
+"""Tests for POST /meta/batch request validation and dispatch."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.meta import routes
+from app.api.meta.routes import batch
+from app.models.meta import BatchRequest
+from app.models.user import User
+
+USER = User(
+    id="user-1",
+    email="user@example.com",
+    created_at=datetime(2024, 1, 1),
+    updated_at=datetime(2024, 1, 1),
+)
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Stub the integration getters used by the batch dispatch table, recording calls."""
+    calls = []
+
+    def stub(name, result):
+        async def getter(*args):
+            calls.append((name, args))
+            if isinstance(result, Exception):
+                raise result
+            return result
+        monkeypatch.setattr(routes.meta_integration, name, getter)
+
+    return stub, calls
+
+
+def _run(ops):
+    return asyncio.run(batch(BatchRequest(ops=ops), "meta-token", USER))
+
+
+def test_ops_run_and_report_in_request_order(graph):
+    stub, calls = graph
+    stub("get_ad_accounts", [{"id": "act_1"}])
+    stub("get_campaigns", [{"id": "c1"}])
+
+    result = _run([
+        {"op": "campaigns", "args": {"account_id": "act_1"}},
+        {"op": "ad_accounts"},
+    ])
+
+    assert result == {"results": [
+        {"op": "campaigns", "data": [{"id": "c1"}]},
+        {"op": "ad_accounts", "data": [{"id": "act_1"}]},
+    ]}
+    assert ("get_campaigns", ("act_1", "meta-token")) in calls
+
+
+def test_failing_op_reports_its_own_error(graph):
+    stub, _ = graph
+    stub("get_ad_accounts", [])
+    stub("get_campaigns", KeyError("body"))
+
+    result = _run([
+        {"op": "campaigns", "args": {"account_id": "act_1"}},
+        {"op": "ad_accounts"},
+    ])
+
+    assert result["results"][0] == {"op": "campaigns", "error": "'body'"}
+    assert result["results"][1] == {"op": "ad_accounts", "data": []}
+
+
+def test_insights_date_range_is_passed_as_a_dict(graph):
+    stub, calls = graph
+    stub("get_insights", [])
+
+    _run([{
+        "op": "insights",
+        "args": {"object_id": "c1", "date_range": {"start": "2024-01-01", "end": "2024-01-07"}},
+    }])
+
+    assert calls == [("get_insights", ("c1", "meta-token", {"start": "2024-01-01", "end": "2024-01-07"}))]
+
+
+@pytest.mark.parametrize("op", [
+    {"op": "campaigns"},
+    {"op": "campaigns", "args": {"account_id": 5}},
+    {"op": "ads", "args": {"adset": "a1"}},
+    {"op": "unknown"},
+])
+def test_invalid_ops_are_rejected_before_dispatch(op):
+    with pytest.raises(ValidationError):
+        BatchRequest(ops=[op])
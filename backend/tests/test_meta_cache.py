@@ -0,0 +1,94 @@
+"""Tests for invalidating cached campaign reads after writes."""
+
+import asyncio
+
+import fakeredis.aioredis
+import httpx
+import pytest
+
+from app.services import meta_integration as mi
+from app.services.meta_integration import MetaIntegrationService
+
+
+class _Graph:
+    """MockTransport handler serving one campaign whose status writes can change."""
+
+    def __init__(self, write_status=200):
+        self.status = "ACTIVE"
+        self.write_status = write_status
+        self.reads = 0
+
+    def __call__(self, request):
+        if request.method == "GET":
+            self.reads += 1
+            return httpx.Response(200, json={"data": [{"id": "c1", "status": self.status}]})
+        if self.write_status == 200:
+            self.status = "PAUSED"
+        if request.url.path.endswith("/"):
+            # Graph batch endpoint: one sub-response per request in the batch
+            return httpx.Response(200, json=[{"code": self.write_status, "body": '{"success": true}'}])
+        return httpx.Response(self.write_status, json={"success": self.write_status == 200})
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(mi, "redis_client", fakeredis.aioredis.FakeRedis(decode_responses=True))
+    service = MetaIntegrationService()
+
+    async def allow(keys, args):
+        return [1, "0"]
+
+    service._rl = allow
+    return service
+
+
+def _read_write_read(service, graph, write):
+    async def scenario():
+        service.client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(graph))
+        before = await service.get_campaigns("act_1", "token")
+        await service.get_campaigns("act_1", "token")
+        await write()
+        after = await service.get_campaigns("act_1", "token")
+        await service.client.aclose()
+        return before, after
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("write", [
+    lambda s: s.update_campaign_status("c1", "token", "PAUSED"),
+    lambda s: s.update_campaign_budget("c1", "token", 5000),
+    lambda s: s.execute_strategy({"campaign_id": "c1", "actions": {"pause_low_performing": True}}, "token"),
+])
+def test_writes_invalidate_cached_campaigns(service, write):
+    graph = _Graph()
+
+    before, after = _read_write_read(service, graph, lambda: write(service))
+
+    assert before == [{"id": "c1", "status": "ACTIVE"}]
+    assert after == [{"id": "c1", "status": "PAUSED"}]
+    assert graph.reads == 2
+
+
+def test_failed_write_keeps_cached_campaigns(service):
+    graph = _Graph(write_status=500)
+
+    _read_write_read(service, graph, lambda: service.update_campaign_status("c1", "token", "PAUSED"))
+
+    assert graph.reads == 1
+
+
+def test_write_does_not_invalidate_other_tokens(service):
+    async def scenario():
+        graph = _Graph()
+        service.client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(graph))
+        await service.get_campaigns("act_1", "other-token")
+        await service.update_campaign_status("c1", "token", "PAUSED")
+        cached = await service.get_campaigns("act_1", "other-token")
+        await service.client.aclose()
+        return graph, cached
+
+    graph, cached = asyncio.run(scenario())
+
+    assert graph.reads == 1
+    assert cached == [{"id": "c1", "status": "ACTIVE"}]
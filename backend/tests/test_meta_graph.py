@@ -0,0 +1,157 @@
+"""Tests for the Graph client's request helpers, against an httpx MockTransport."""
+
+import asyncio
+
+import fakeredis.aioredis
+import httpx
+import orjson
+import pytest
+
+from app.services import meta_integration as mi
+from app.services.meta_integration import GRAPH_BATCH_LIMIT, MetaIntegrationService
+
+
+@pytest.fixture
+def service():
+    service = MetaIntegrationService()
+
+    async def allow(keys, args):
+        return [1, "0"]
+
+    service._rl = allow
+    return service
+
+
+def _run(service, handler, call):
+    """Run ``call(service)`` with Graph requests answered by ``handler``."""
+    async def scenario():
+        service.client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(handler))
+        try:
+            return await call(service)
+        finally:
+            await service.client.aclose()
+
+    return asyncio.run(scenario())
+
+
+def _batch_of(request):
+    return orjson.loads(dict(httpx.QueryParams(request.content.decode()))["batch"])
+
+
+def test_graph_batch_splits_into_chunks_and_keeps_order(service):
+    sizes = []
+
+    def handler(request):
+        batch = _batch_of(request)
+        sizes.append(len(batch))
+        return httpx.Response(200, json=[
+            {"code": 200, "body": orjson.dumps({"url": sub["relative_url"]}).decode()} for sub in batch
+        ])
+
+    requests = [{"method": "GET", "relative_url": f"obj_{i}"} for i in range(GRAPH_BATCH_LIMIT + 5)]
+    bodies = _run(service, handler, lambda s: s._graph_batch("token", requests))
+
+    assert sorted(sizes) == [5, GRAPH_BATCH_LIMIT]
+    assert bodies == [{"url": f"obj_{i}"} for i in range(GRAPH_BATCH_LIMIT + 5)]
+
+
+def test_graph_batch_returns_none_for_failed_sub_requests(service):
+    def handler(request):
+        return httpx.Response(200, json=[
+            {"code": 200, "body": '{"id": "1"}'},
+            {"code": 400, "body": '{"error": {}}'},
+            None,
+        ])
+
+    requests = [{"method": "GET", "relative_url": str(i)} for i in range(3)]
+
+    assert _run(service, handler, lambda s: s._graph_batch("token", requests)) == [{"id": "1"}, None, None]
+
+
+def test_graph_batch_returns_none_for_a_failed_chunk(service):
+    def handler(request):
+        batch = _batch_of(request)
+        if len(batch) == GRAPH_BATCH_LIMIT:
+            return httpx.Response(500)
+        return httpx.Response(200, json=[{"code": 200, "body": "{}"} for _ in batch])
+
+    requests = [{"method": "GET", "relative_url": str(i)} for i in range(GRAPH_BATCH_LIMIT + 1)]
+    bodies = _run(service, handler, lambda s: s._graph_batch("token", requests))
+
+    assert bodies == [None] * GRAPH_BATCH_LIMIT + [{}]
+
+
+def test_paginated_follows_next_links_without_resending_params(service):
+    seen = []
+    next_url = "https://graph.facebook.com/v18.0/act_1/campaigns?after=abc&access_token=token"
+
+    def handler(request):
+        seen.append(request.url)
+        if "after" in request.url.params:
+            return httpx.Response(200, json={"data": [{"id": "c2"}]})
+        return httpx.Response(200, json={"data": [{"id": "c1"}], "paging": {"next": next_url}})
+
+    campaigns = _run(service, handler, lambda s: s._paginated(
+        "/act_1/campaigns", (("access_token", "token"), ("fields", "id")), "token"
+    ))
+
+    assert campaigns == [{"id": "c1"}, {"id": "c2"}]
+    assert seen[0].params["fields"] == "id"
+    assert str(seen[1]) == next_url
+
+
+def test_a_failed_page_empties_the_guarded_getter(service):
+    def handler(request):
+        if "after" in request.url.params:
+            return httpx.Response(500)
+        return httpx.Response(200, json={
+            "data": [{"id": "c1"}],
+            "paging": {"next": "https://graph.facebook.com/v18.0/act_1/adsets?after=abc"}
+        })
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _run(service, handler, lambda s: s._paginated("/act_1/adsets", None, "token"))
+    assert _run(service, handler, lambda s: s.get_insights("act_1", "token")) == []
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    monkeypatch.setattr(mi, "redis_client", fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+
+def test_execute_strategy_sends_all_changes_in_one_batch_update(service, fake_redis):
+    batches = []
+
+    def handler(request):
+        batches.append(_batch_of(request))
+        return httpx.Response(200, json=[{"code": 200, "body": '{"success": true}'}])
+
+    strategy = {
+        "campaign_id": "c1",
+        "actions": {"pause_low_performing": True, "increase_budget": True},
+        "performance_metrics": {"spend": 50},
+    }
+
+    assert _run(service, handler, lambda s: s.execute_strategy(strategy, "token")) is True
+    assert batches == [[{"method": "POST", "relative_url": "c1", "body": "status=PAUSED&daily_budget=6000"}]]
+
+
+def test_bulk_update_fails_if_any_update_fails(service, fake_redis):
+    def handler(request):
+        return httpx.Response(200, json=[
+            {"code": 200, "body": '{"success": true}'},
+            {"code": 400, "body": '{"error": {}}'},
+        ])
+
+    updates = [("c1", {"status": "PAUSED"}), ("c2", {"status": "PAUSED"})]
+
+    assert _run(service, handler, lambda s: s._bulk_update(updates, "token")) is False
+
+
+def test_strategy_without_actions_sends_nothing(service, fake_redis):
+    def handler(request):
+        raise AssertionError("no request expected")
+
+    strategy = {"campaign_id": "c1", "actions": {}}
+
+    assert _run(service, handler, lambda s: s.execute_strategy(strategy, "token")) is True
@@ -0,0 +1,92 @@
+"""Tests for Graph request throttling and the Redis token-bucket script."""
+
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+from redis.exceptions import RedisError
+
+from app.services import meta_integration as mi
+from app.services.meta_integration import MetaIntegrationService, _RATE_LIMIT_SCRIPT
+
+
+@pytest.fixture
+def service():
+    return MetaIntegrationService()
+
+
+async def _send():
+    return "sent"
+
+
+def test_throttled_waits_for_retry_after_then_sends(service, monkeypatch):
+    replies = iter([[0, "0.25"], [1, "0"]])
+    sleeps = []
+
+    async def rl(keys, args):
+        return next(replies)
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    service._rl = rl
+    monkeypatch.setattr(mi.asyncio, "sleep", sleep)
+
+    assert asyncio.run(service._throttled(_send(), "token")) == "sent"
+    assert sleeps == [0.25]
+
+
+def test_throttled_sends_unthrottled_when_redis_is_down(service):
+    async def rl(keys, args):
+        raise RedisError("down")
+
+    service._rl = rl
+
+    assert asyncio.run(service._throttled(_send(), "token")) == "sent"
+
+
+def test_throttled_caps_cost_at_bucket_capacity_and_hides_the_token(service):
+    seen = {}
+
+    async def rl(keys, args):
+        seen["keys"], seen["args"] = keys, args
+        return [1, "0"]
+
+    service._rl = rl
+    asyncio.run(service._throttled(_send(), "secret-token", cost=10_000))
+
+    assert seen["args"][-1] == mi.settings.meta_rate_limit_capacity
+    assert "secret-token" not in seen["keys"][0]
+
+
+def _bucket(capacity, refill_rate):
+    script = fakeredis.aioredis.FakeRedis(decode_responses=True).register_script(_RATE_LIMIT_SCRIPT)
+
+    async def take(requested=1):
+        allowed, retry_after = await script(keys=["bucket"], args=[capacity, refill_rate, requested])
+        return int(allowed), float(retry_after)
+
+    return take
+
+
+def test_bucket_admits_up_to_capacity_then_denies_with_retry_after():
+    async def scenario():
+        take = _bucket(capacity=3, refill_rate=1)
+        return [await take() for _ in range(4)]
+
+    results = asyncio.run(scenario())
+
+    assert [allowed for allowed, _ in results] == [1, 1, 1, 0]
+    assert results[-1][1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_bucket_retry_after_covers_the_missing_tokens():
+    async def scenario():
+        take = _bucket(capacity=10, refill_rate=2)
+        await take(10)
+        return await take(4)
+
+    allowed, retry_after = asyncio.run(scenario())
+
+    assert allowed == 0
+    assert retry_after == pytest.approx(2.0, abs=0.05)
@@ -0,0 +1,95 @@
+"""Tests for coalescing concurrent identical Graph reads."""
+
+import asyncio
+
+from app.services.meta_integration import _singleflight
+
+
+class _Reader:
+    """Minimal host for ``_singleflight`` that counts and gates underlying calls."""
+
+    def __init__(self):
+        self._inflight = {}
+        self.calls = []
+        self.release = asyncio.Event()
+
+    @_singleflight
+    async def read(self, object_id, access_token):
+        self.calls.append(object_id)
+        await self.release.wait()
+        return {"id": object_id}
+
+
+def test_concurrent_identical_reads_share_one_call():
+    async def scenario():
+        reader = _Reader()
+        tasks = [asyncio.create_task(reader.read("act_1", "token")) for _ in range(5)]
+        await asyncio.sleep(0)
+        reader.release.set()
+        return reader, await asyncio.gather(*tasks)
+
+    reader, results = asyncio.run(scenario())
+
+    assert reader.calls == ["act_1"]
+    assert results == [{"id": "act_1"}] * 5
+    assert reader._inflight == {}
+
+
+def test_reads_for_different_objects_or_tokens_are_not_shared():
+    async def scenario():
+        reader = _Reader()
+        tasks = [
+            asyncio.create_task(reader.read("act_1", "token-a")),
+            asyncio.create_task(reader.read("act_2", "token-a")),
+            asyncio.create_task(reader.read("act_1", "token-b")),
+        ]
+        await asyncio.sleep(0)
+        reader.release.set()
+        await asyncio.gather(*tasks)
+        return reader
+
+    assert sorted(asyncio.run(scenario()).calls) == ["act_1", "act_1", "act_2"]
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    async def scenario():
+        reader = _Reader()
+        leader = asyncio.create_task(reader.read("act_1", "token"))
+        follower = asyncio.create_task(reader.read("act_1", "token"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        reader.release.set()
+        return leader, await follower, reader
+
+    leader, result, reader = asyncio.run(scenario())
+
+    assert leader.cancelled()
+    assert result == {"id": "act_1"}
+    assert reader.calls == ["act_1"]
+
+
+def test_failures_reach_every_caller_and_are_not_remembered():
+    class Failing:
+        def __init__(self):
+            self._inflight = {}
+            self.calls = 0
+
+        @_singleflight
+        async def read(self, access_token):
+            self.calls += 1
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+    async def scenario():
+        failing = Failing()
+        first = await asyncio.gather(
+            failing.read("token"), failing.read("token"), return_exceptions=True
+        )
+        second = await asyncio.gather(failing.read("token"), return_exceptions=True)
+        return failing, first + second
+
+    failing, results = asyncio.run(scenario())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert failing.calls == 2
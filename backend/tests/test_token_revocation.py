@@ -0,0 +1,126 @@
+"""Tests for logout token blacklisting and its enforcement in get_current_user."""
+
+import asyncio
+from datetime import datetime
+
+import fakeredis.aioredis
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.exceptions import RedisError
+
+from app.api import deps
+from app.api.auth.routes import logout
+from app.core.config import settings
+from app.models.user import User
+from app.services import auth, auth_cache
+from app.services.auth import auth_service
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(auth, "redis_client", client)
+    auth_cache._token_cache.clear()
+    yield client
+    auth_cache._token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def known_user(monkeypatch):
+    user = User(
+        id="user-1",
+        email="user@example.com",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+    async def get(user_id):
+        return user if user_id == user.id else None
+
+    monkeypatch.setattr(deps.user_cache_service, "get", get)
+    return user
+
+
+def _credentials(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_valid_token_resolves_user(known_user):
+    token = auth_service.create_access_token({"sub": known_user.id})
+
+    assert asyncio.run(deps.get_current_user(_credentials(token))) == known_user
+
+
+def test_revoked_token_gets_401(known_user):
+    token = auth_service.create_access_token({"sub": known_user.id})
+    token_data = auth_service.verify_token(token)
+
+    async def scenario():
+        # Resolve once first so the token is sitting in the in-process cache
+        await deps.get_current_user(_credentials(token))
+        await auth_service.revoke_token(token, token_data.exp)
+        await deps.get_current_user(_credentials(token))
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(scenario())
+
+    assert exc_info.value.status_code == 401
+
+
+def test_blacklist_entry_expires_with_the_token(fake_redis, known_user):
+    token = auth_service.create_access_token({"sub": known_user.id})
+    token_data = auth_service.verify_token(token)
+
+    async def ttl():
+        await auth_service.revoke_token(token, token_data.exp)
+        return await fake_redis.ttl(auth_service._blacklist_key(token))
+
+    assert 0 < asyncio.run(ttl()) <= settings.access_token_expire_minutes * 60
+
+
+def test_already_expired_token_is_not_stored(fake_redis):
+    async def revoke_and_count():
+        await auth_service.revoke_token("expired", 1)
+        return await fake_redis.dbsize()
+
+    assert asyncio.run(revoke_and_count()) == 0
+
+
+class _DownRedis:
+    """Redis stand-in whose every command fails."""
+
+    async def setex(self, *args):
+        raise RedisError("down")
+
+    async def exists(self, *args):
+        raise RedisError("down")
+
+
+def test_logout_returns_503_when_revocation_cannot_be_stored(monkeypatch, known_user):
+    monkeypatch.setattr(auth, "redis_client", _DownRedis())
+    token = auth_service.create_access_token({"sub": known_user.id})
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(logout(_credentials(token), known_user))
+
+    assert exc_info.value.status_code == 503
+
+
+def test_logout_succeeds_once_token_is_blacklisted(known_user):
+    token = auth_service.create_access_token({"sub": known_user.id})
+
+    async def scenario():
+        response = await logout(_credentials(token), known_user)
+        return response, await auth_service.is_token_revoked(token)
+
+    response, revoked = asyncio.run(scenario())
+
+    assert response == {"message": "Successfully logged out"}
+    assert revoked is True
+
+
+def test_blacklist_lookup_fails_open_when_redis_is_down(monkeypatch):
+    monkeypatch.setattr(auth, "redis_client", _DownRedis())
+
+    assert asyncio.run(auth_service.is_token_revoked("token")) is False